@@ -29,6 +29,64 @@
 
   let secret = 0, limit=10, attemptsLeft=0, hintsUsed=0, score=0, startTime=0;
 
+  // Server mode: when served by cartoon_guess_server.py the secret, hints and scoring
+  // live on the server and this page only talks to it over /ws. Opened from disk, the
+  // game keeps running locally as before.
+  let socket = null;
+
+  function connectServer(){
+    if(!/^https?:$/.test(location.protocol) || !window.WebSocket) return;
+    try{
+      const ws = new WebSocket((location.protocol === 'https:' ? 'wss://' : 'ws://') + location.host + '/ws');
+      ws.onopen = ()=>{ socket = ws; send({type:'leaderboard'}); };
+      ws.onmessage = e => { try{ onServerMessage(JSON.parse(e.data)); }catch(err){} };
+      ws.onclose = ()=>{ socket = null; };
+    }catch(e){ socket = null; }
+  }
+  function send(msg){
+    msg.name = (playerName.value || 'Player').trim();
+    socket.send(JSON.stringify(msg));
+  }
+  function applyServerState(m){
+    limit = m.range;
+    attemptsLeft = m.attempts_left;
+    hintsUsed = 3 - m.hints_left;
+    score = m.score;
+    setMeta();
+  }
+  function onServerMessage(m){
+    if(m.type === 'started'){
+      applyServerState(m);
+      const c = CHARACTERS[charSel.value];
+      speech.innerHTML = `${c[1]} <strong>${c[0]}</strong> — Guess a number between 1 and ${limit}`;
+      log.innerHTML = `Round started for <strong>${(playerName.value||'Player').trim()}</strong>. Good luck!`;
+      playSound('start');
+      guessInput.focus();
+    }else if(m.type === 'hint'){
+      applyServerState(m);
+      log.innerHTML = `💡 Hint: ${m.text}`;
+      playSound('hint');
+    }else if(m.type === 'result'){
+      applyServerState(m);
+      if(m.result === 'correct'){
+        log.innerHTML = `🎉 Correct! You found it in ${m.time}s. Score: ${m.score}`;
+        playSound('win');
+        send({type:'leaderboard'});
+      }else if(m.result === 'out'){
+        log.innerHTML = `💥 Out of attempts! The number was ${m.secret}.`;
+        playSound('lose');
+        send({type:'leaderboard'});
+      }else{
+        log.innerHTML = m.result === 'low' ? '⬆️ Too low!' : '⬇️ Too high!';
+        playSound('pop');
+      }
+    }else if(m.type === 'leaderboard'){
+      renderEntries(m.entries);
+    }else if(m.type === 'error'){
+      log.innerHTML = m.message;
+    }
+  }
+
   function loadLeaderboard(){
     try{
       const raw = localStorage.getItem(LeaderKey);
@@ -47,7 +105,10 @@
   }
 
   function renderLeaderboard(){
-    const table = loadLeaderboard();
+    renderEntries(loadLeaderboard());
+  }
+
+  function renderEntries(table){
     leaderList.innerHTML = '';
     if(table.length===0){ leaderList.innerHTML = '<li>(empty)</li>'; return }
     table.slice(0,10).forEach(e=>{
@@ -71,6 +132,7 @@
   }
 
   function startRound(){
+    if(socket){ send({type:'start', level: levelSel.value}); return }
     const name = (playerName.value || 'Player').trim();
     const levelIdx = levelSel.value;
     const charIdx = charSel.value;
@@ -89,6 +151,7 @@
   }
 
   function giveHint(){
+    if(socket){ send({type:'hint'}); return }
     if(hintsUsed >= 3){ log.innerHTML = 'No hints left.'; return }
     const t = hintsUsed % 3;
     let hintText = '';
@@ -118,6 +181,7 @@
     if(!val){ log.innerHTML = 'Enter a guess!'; return }
     const g = parseInt(val,10);
     if(isNaN(g)){ log.innerHTML = 'Invalid number.'; return }
+    if(socket){ send({type:'guess', value: g}); return }
 
     if(g === secret){
       const elapsed = Math.floor((Date.now()-startTime)/1000);
@@ -159,4 +223,5 @@
   // init
   renderLeaderboard();
   setMeta();
+  connectServer();
 })();
@@ -0,0 +1,263 @@
+# cartoon_guess_daily.py
+"""
+Daily challenge for the Cartoon Number Guessing Game.
+ - Every install derives the same secrets: seed = hash of the (UTC) date, then a counter-based
+   generator (SplitMix64 finaliser) maps (seed, level, round) -> secret in O(1);
+   no coordination, no storage
+ - A year's schedule can be precomputed into a compact byte table (one byte per secret)
+   and cached in assets/ for instant lookups
+ - Each install logs its daily rounds in assets/daily/<date>.jsonl (DailyProgress): a line when
+   a round starts and one with its result, so restarting the app can't replay a secret that
+   was already in play; a lost (or abandoned) round ends that level's challenge for the day
+ - Results (date, level, round, guesses, hints, time, score) are checked against the derived
+   secret and the scoring rules; `verify` accepts the daily logs directly
+
+Run:
+  python cartoon_guess_daily.py show [YYYY-MM-DD]
+  python cartoon_guess_daily.py precompute [YEAR]
+  python cartoon_guess_daily.py verify assets/daily/2025-01-01.jsonl > rejected.jsonl
+"""
+
+import argparse, calendar, hashlib, json, os, sys
+from datetime import date, datetime, timedelta
+
+from cartoon_guess_rules import LEVELS
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+DAILY_DIR = os.path.join(ASSETS_DIR, "daily")
+ROUNDS_PER_DAY = 10
+SEED_SALT = b"cartoon-guess-daily-v1:"
+MASK64 = (1 << 64) - 1
+LEVEL_ORDER = sorted(LEVELS)
+
+# -------------------------
+# Generator
+# -------------------------
+def today():
+    # UTC so every timezone plays the same challenge
+    return datetime.utcnow().date()
+
+
+def daily_seed(day):
+    return int.from_bytes(hashlib.sha256(SEED_SALT + day.isoformat().encode()).digest()[:8], 'little')
+
+
+def mix64(x):
+    """SplitMix64 finaliser: a strong 64-bit mix of a counter."""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def secret_from_seed(seed, level_choice, round_no):
+    _, rng, _ = LEVELS[level_choice]
+    counter = (int(level_choice) << 32) | round_no
+    # multiply-shift maps 64 random bits onto 1..rng without a modulo
+    return ((mix64(seed ^ counter) * rng) >> 64) + 1
+
+
+def daily_secret(day, level_choice, round_no):
+    """Secret for round `round_no` (1-based) of `level_choice` on `day`."""
+    return secret_from_seed(daily_seed(day), level_choice, round_no)
+
+# -------------------------
+# Year schedule
+# -------------------------
+class YearSchedule:
+    """All secrets of a year in one byte table: [day][level][round] -> secret."""
+
+    def __init__(self, year, rounds=ROUNDS_PER_DAY, table=None):
+        self.year = year
+        self.rounds = rounds
+        self.days = 366 if calendar.isleap(year) else 365
+        self.table = table if table is not None else self._build()
+
+    def _build(self):
+        out = bytearray()
+        start = date(self.year, 1, 1)
+        for d in range(self.days):
+            seed = daily_seed(start + timedelta(days=d))
+            for level in LEVEL_ORDER:
+                out.extend(secret_from_seed(seed, level, r) for r in range(1, self.rounds + 1))
+        return bytes(out)
+
+    def secret(self, day, level_choice, round_no):
+        if day.year != self.year or not 1 <= round_no <= self.rounds:
+            return daily_secret(day, level_choice, round_no)
+        i = ((day.timetuple().tm_yday - 1) * len(LEVEL_ORDER) + LEVEL_ORDER.index(level_choice)) \
+            * self.rounds + round_no - 1
+        return self.table[i]
+
+    @classmethod
+    def cache_path(cls, year, rounds=ROUNDS_PER_DAY):
+        return os.path.join(ASSETS_DIR, f"daily-{year}-r{rounds}.bin")
+
+    @classmethod
+    def load(cls, year, rounds=ROUNDS_PER_DAY):
+        """Cached table from assets/ if present and valid, else build and cache it."""
+        path = cls.cache_path(year, rounds)
+        try:
+            with open(path, 'rb') as f:
+                table = f.read()
+            sched = cls(year, rounds, table)
+            if len(table) == sched.days * len(LEVEL_ORDER) * rounds:
+                return sched
+        except OSError:
+            pass
+        sched = cls(year, rounds)
+        try:
+            os.makedirs(ASSETS_DIR, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(sched.table)
+        except OSError:
+            pass
+        return sched
+
+# -------------------------
+# Progress / results
+# -------------------------
+class DailyProgress:
+    """One level's daily challenge on this install, persisted in DAILY_DIR/<date>.jsonl."""
+
+    def __init__(self, day, level_choice, directory=DAILY_DIR):
+        self.day = day
+        self.level = level_choice
+        self.path = os.path.join(directory, f"{day.isoformat()}.jsonl")
+        self.started = 0
+        self.results = {}
+        for rec in self._read():
+            if rec.get("level") != level_choice:
+                continue
+            round_no = int(rec.get("round", 0))
+            self.started = max(self.started, round_no)
+            if rec.get("status") != "started":
+                self.results[round_no] = rec
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict):
+                records.append(rec)
+        return records
+
+    def _append(self, rec):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    def over(self):
+        """True once a round was lost or abandoned, or every round has been played."""
+        for round_no in range(1, self.started + 1):
+            rec = self.results.get(round_no)
+            if rec is None or rec.get("status") != "won":
+                return True
+        return self.started >= ROUNDS_PER_DAY
+
+    def next_round(self):
+        return None if self.over() else self.started + 1
+
+    def total_score(self):
+        return sum(int(rec.get("score", 0)) for rec in self.results.values())
+
+    def begin(self):
+        """Log the next round as started and return its number (None if the challenge is over)."""
+        round_no = self.next_round()
+        if round_no is None:
+            return None
+        self._append({"date": self.day.isoformat(), "level": self.level, "round": round_no,
+                      "status": "started"})
+        self.started = round_no
+        return round_no
+
+    def finish(self, name, guesses, hints, time_taken, score, won):
+        """Log the current round's result (verify_submission format) and return it."""
+        rec = {"date": self.day.isoformat(), "level": self.level, "round": self.started,
+               "status": "won" if won else "lost", "name": name, "guesses": list(guesses),
+               "hints": hints, "time": time_taken, "score": score}
+        self._append(rec)
+        self.results[self.started] = rec
+        return rec
+
+# -------------------------
+# Verification
+# -------------------------
+def verify_submission(sub):
+    """None if a daily challenge result is genuine, else the reason it was rejected.
+    sub: {"date": "YYYY-MM-DD", "level": "1", "round": 1, "guesses": [...],
+          "hints": 0, "time": 12, "score": 150}"""
+    from cartoon_guess_verify import verify
+    try:
+        day = date.fromisoformat(sub["date"])
+        level = str(sub["level"])
+        round_no = int(sub["round"])
+        guesses = [int(g) for g in sub["guesses"]]
+        hints, time_taken, score = int(sub.get("hints", 0)), int(sub["time"]), int(sub["score"])
+    except (KeyError, TypeError, ValueError):
+        return "malformed submission"
+    if level not in LEVELS:
+        return "unknown level"
+    if not 1 <= round_no <= ROUNDS_PER_DAY:
+        return f"round must be 1..{ROUNDS_PER_DAY}"
+    if day > today() + timedelta(days=1):
+        return "challenge date is in the future"
+    if not guesses:
+        return "no guesses"
+    secret = daily_secret(day, level, round_no)
+    if secret in guesses[:-1]:
+        return "guessed the secret but kept playing"
+    if guesses[-1] != secret and score != 0:
+        return "scored without finding the secret"
+    return verify(score, time_taken, level, len(guesses), hints)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Daily challenge tools")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    s = sub.add_parser('show', help="print a day's secrets")
+    s.add_argument('day', nargs='?')
+    p = sub.add_parser('precompute', help="build and cache a year's schedule")
+    p.add_argument('year', nargs='?', type=int)
+    v = sub.add_parser('verify', help="check daily challenge submissions (JSON lines)")
+    v.add_argument('input', nargs='?', default='-')
+    args = parser.parse_args(argv)
+    if args.cmd == 'show':
+        day = date.fromisoformat(args.day) if args.day else today()
+        for level in LEVEL_ORDER:
+            secrets = [daily_secret(day, level, r) for r in range(1, ROUNDS_PER_DAY + 1)]
+            print(f"{day} {LEVELS[level][0]:<6} {secrets}")
+    elif args.cmd == 'precompute':
+        sched = YearSchedule.load(args.year or today().year)
+        print(f"{sched.year}: {len(sched.table)} secrets cached in {YearSchedule.cache_path(sched.year)}")
+    else:
+        f = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+        rejected = 0
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    rec, reason = line.strip(), "malformed submission"
+                else:
+                    if isinstance(rec, dict) and rec.get("status") == "started":
+                        continue  # DailyProgress start marker, not a result
+                    reason = verify_submission(rec)
+                if reason is not None:
+                    rejected += 1
+                    print(json.dumps({"record": rec, "reason": reason}, ensure_ascii=False))
+        print(f"rejected {rejected} submission(s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,307 @@
+# cartoon_guess_export.py
+"""
+Streaming columnar export of scores and rounds for analysis notebooks.
+ - One directory per export: manifest.json + one raw typed-array file per column per chunk
+   (part-00000.score.bin, ...), so a reader only opens the columns it asks for
+ - Records are written a chunk at a time (constant memory, whatever the row count)
+ - `name` is dictionary-encoded (uint32 codes + dict.name.jsonl, appended as new names appear)
+ - `when` ISO strings become epoch seconds (int64); `level` accepts the verifier's aliases
+   ('1' / 1 / 'easy')
+ - Malformed records (missing or non-numeric score/time/level/...) are counted and skipped; the manifest is only written once an export
+   completes, so an aborted export never looks valid
+
+Run:
+  python cartoon_guess_export.py scores out_dir [--store assets/leaderboard.sqlite]
+  python cartoon_guess_export.py rounds submissions.jsonl out_dir
+  python cartoon_guess_export.py read out_dir --columns score time
+"""
+
+import argparse, array, json, os, sys
+from datetime import datetime
+
+from cartoon_guess_verify import LEVEL_ALIASES
+
+FORMAT_VERSION = 1
+CHUNK_ROWS = 65536
+DICT = 'dict'  # column type for dictionary-encoded strings (codes stored as 'I')
+
+SCORE_SCHEMA = [("name", DICT), ("score", 'i'), ("time", 'i'), ("when", 'q')]
+_EPOCH = datetime(1970, 1, 1)
+
+ROUND_SCHEMA = [("name", DICT), ("level", 'b'), ("attempts", 'b'), ("hints", 'b'),
+                ("score", 'i'), ("time", 'i'), ("won", 'b'), ("when", 'q')]
+
+
+def iso_to_epoch(value):
+    """'2025-11-30T22:11:19.782135Z' -> 1764540679 (0 when missing / unparsable)."""
+    if not value:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        dt = datetime.fromisoformat(value[:-1] if value.endswith('Z') else value)
+    except ValueError:
+        return 0
+    if dt.tzinfo is None:
+        return int((dt - _EPOCH).total_seconds())  # naive stamps are UTC ("...Z")
+    return int(dt.timestamp())
+
+def _to_int(value):
+    # numeric columns are required: a missing value makes the record malformed, not 0
+    if value is None or value == "":
+        raise ValueError("missing value")
+    return int(value)
+
+def _to_level(value):
+    level = LEVEL_ALIASES.get(value.strip().lower() if isinstance(value, str) else value)
+    if level is None:
+        raise ValueError(f"unknown level {value!r}")
+    return int(level)
+
+# -------------------------
+# Writer
+# -------------------------
+class ColumnarWriter:
+    """Append records (dicts) and they are written out chunk by chunk."""
+
+    def __init__(self, path, schema, chunk_rows=CHUNK_ROWS):
+        self.path = path
+        self.schema = list(schema)
+        self.chunk_rows = chunk_rows
+        self.chunks = []
+        self.rows = 0
+        self.skipped = 0
+        self._dicts = {}
+        self._dict_files = {}
+        os.makedirs(path, exist_ok=True)
+        # a manifest left by an earlier export must not vouch for this one's files
+        try:
+            os.remove(os.path.join(path, "manifest.json"))
+        except FileNotFoundError:
+            pass
+        for col, kind in self.schema:
+            if kind == DICT:
+                self._dicts[col] = {}
+                self._dict_files[col] = open(os.path.join(path, f"dict.{col}.jsonl"), 'w',
+                                             encoding='utf-8')
+        self._new_chunk()
+
+    def _new_chunk(self):
+        self._columns = {col: array.array('I' if kind == DICT else kind)
+                         for col, kind in self.schema}
+        # (field, append, convert) per column, resolved once per chunk instead of per value
+        self._plan = []
+        for col, kind in self.schema:
+            if kind == DICT:
+                convert = (lambda c: lambda v: self._encode(c, v))(col)
+            elif col == "when":
+                convert = iso_to_epoch
+            elif col == "level":
+                convert = _to_level
+            else:
+                convert = _to_int
+            self._plan.append((col, self._columns[col].append, convert))
+        self._pending = 0
+
+    def _encode(self, col, value):
+        codes = self._dicts[col]
+        value = "" if value is None else str(value)
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self._dict_files[col].write(json.dumps(value, ensure_ascii=False) + "\n")
+        return code
+
+    def write(self, record):
+        """Append one record; returns False (and counts it in .skipped) if it is malformed."""
+        done = 0
+        try:
+            get = record.get
+            row = [convert(get(col)) for col, _, convert in self._plan]
+            for (_, append, _), value in zip(self._plan, row):
+                append(value)  # OverflowError when a value doesn't fit the column type
+                done += 1
+        except (AttributeError, TypeError, ValueError, OverflowError):
+            # undo a partial row so the columns stay the same length
+            for col, _, _ in self._plan[:done]:
+                self._columns[col].pop()
+            self.skipped += 1
+            return False
+        self._pending += 1
+        if self._pending >= self.chunk_rows:
+            self._flush_chunk()
+        return True
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def _flush_chunk(self):
+        if not self._pending:
+            return
+        name = f"part-{len(self.chunks):05d}"
+        for col, values in self._columns.items():
+            with open(os.path.join(self.path, f"{name}.{col}.bin"), 'wb') as f:
+                values.tofile(f)
+        self.chunks.append({"file": name, "rows": self._pending})
+        self.rows += self._pending
+        self._new_chunk()
+
+    def close(self):
+        self._flush_chunk()
+        for f in self._dict_files.values():
+            f.close()
+        manifest = {
+            "version": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "rows": self.rows,
+            "skipped": self.skipped,
+            "schema": [{"name": col, "type": kind,
+                        "itemsize": array.array('I' if kind == DICT else kind).itemsize}
+                       for col, kind in self.schema],
+            "chunks": self.chunks,
+        }
+        tmp = os.path.join(self.path, "manifest.json.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, os.path.join(self.path, "manifest.json"))
+
+    def __enter__(self):
+        return self
+
+    def abort(self):
+        """Stop without a manifest: the directory is left unreadable rather than truncated."""
+        for f in self._dict_files.values():
+            f.close()
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.close()
+        else:
+            self.abort()
+
+# -------------------------
+# Reader
+# -------------------------
+def read_manifest(path):
+    with open(os.path.join(path, "manifest.json"), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_dictionary(path, col):
+    with open(os.path.join(path, f"dict.{col}.jsonl"), 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def iter_chunks(path, columns=None):
+    """Yield {column: array} per chunk, reading only the requested columns' files."""
+    manifest = read_manifest(path)
+    types = {c["name"]: c["type"] for c in manifest["schema"]}
+    columns = list(types) if columns is None else list(columns)
+    for col in columns:
+        if col not in types:
+            raise KeyError(f"unknown column {col!r}; have {', '.join(types)}")
+    swap = manifest["byteorder"] != sys.byteorder
+    for chunk in manifest["chunks"]:
+        out = {}
+        for col in columns:
+            values = array.array('I' if types[col] == DICT else types[col])
+            with open(os.path.join(path, f"{chunk['file']}.{col}.bin"), 'rb') as f:
+                values.frombytes(f.read())
+            if swap:
+                values.byteswap()
+            out[col] = values
+        yield out
+
+
+def read_columns(path, columns=None, decode=True):
+    """Whole columns as arrays; dictionary columns come back as lists of str when decode=True."""
+    manifest = read_manifest(path)
+    types = {c["name"]: c["type"] for c in manifest["schema"]}
+    result = None
+    for chunk in iter_chunks(path, columns):
+        if result is None:
+            result = chunk
+        else:
+            for col, values in chunk.items():
+                result[col].extend(values)
+    if result is None:
+        result = {col: array.array('I' if types[col] == DICT else types[col])
+                  for col in (columns or types)}
+    if decode:
+        for col, values in result.items():
+            if types[col] == DICT:
+                words = read_dictionary(path, col)
+                result[col] = [words[c] for c in values]
+    return result
+
+# -------------------------
+# Sources / CLI
+# -------------------------
+def export_scores(out_dir, store_path=None, chunk_rows=CHUNK_ROWS):
+    from cartoon_guess_storage import open_store
+    store = open_store(store_path)
+    try:
+        with ColumnarWriter(out_dir, SCORE_SCHEMA, chunk_rows) as writer:
+            writer.write_many(store.iter_entries())
+        return writer.rows, writer.skipped
+    finally:
+        store.close()
+
+
+def _round_records(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                rec = None
+            if not isinstance(rec, dict):
+                yield None  # counted as skipped by the writer
+                continue
+            rec.setdefault("won", 1 if rec.get("score") else 0)
+            yield rec
+
+
+def export_rounds(in_path, out_dir, chunk_rows=CHUNK_ROWS):
+    with ColumnarWriter(out_dir, ROUND_SCHEMA, chunk_rows) as writer:
+        writer.write_many(_round_records(in_path))
+    return writer.rows, writer.skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Columnar export of scores and rounds")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    s = sub.add_parser('scores', help="export the leaderboard store")
+    s.add_argument('out_dir')
+    s.add_argument('--store', help="leaderboard path (default: CARTOON_GUESS_STORE / leaderboard.json)")
+    r = sub.add_parser('rounds', help="export round records from JSON lines")
+    r.add_argument('input')
+    r.add_argument('out_dir')
+    rd = sub.add_parser('read', help="load columns and print a summary")
+    rd.add_argument('path')
+    rd.add_argument('--columns', nargs='+')
+    args = parser.parse_args(argv)
+    if args.cmd in ('scores', 'rounds'):
+        if args.cmd == 'scores':
+            rows, skipped = export_scores(args.out_dir, args.store)
+        else:
+            rows, skipped = export_rounds(args.input, args.out_dir)
+        print(f"exported {rows} {args.cmd[:-1]} rows to {args.out_dir}"
+              + (f" (skipped {skipped} malformed)" if skipped else ""))
+    else:
+        for col, values in read_columns(args.path, args.columns).items():
+            if values and isinstance(values[0], str):
+                print(f"{col:>9}: {len(values)} rows, {len(set(values))} distinct")
+            elif values:
+                print(f"{col:>9}: {len(values)} rows, min {min(values)}, max {max(values)}, "
+                      f"mean {sum(values) / len(values):.2f}")
+            else:
+                print(f"{col:>9}: 0 rows")
+
+
+if __name__ == '__main__':
+    main()
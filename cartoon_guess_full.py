@@ -3,29 +3,44 @@
 Cartoon Number Guessing Game — Full Console Version
 Features:
  - Cross-platform sound (pygame preferred, winsound fallback on Windows)
- - Cute Cartoon Sound Pack (place sound files in assets/sounds/)
+ - Cute Cartoon Sound Pack built in (synthesised in memory, see cartoon_guess_sounds.py);
+   wav files placed in assets/sounds/ replace the built-in ones
  - Levels: Easy / Medium / Hard
  - Character selection (Cat, Robot, Panda, Dino)
- - Hints (3 per game): range hint, parity/divisibility, +/-5 proximity
+ - Hints (3 per game): picks the most informative hint for what you don't know yet
+   (range, parity/divisibility, +/-5 proximity, halves — see cartoon_guess_hints.py)
+ - Daily challenge: the same secrets on every install for the day (see cartoon_guess_daily.py)
  - ASCII UI menu
- - Leaderboard saved in leaderboard.json (Top 10 sorted by score, then time)
+ - Leaderboard saved in leaderboard.json (Top 10 sorted by score, then time), or SQLite via
+   CARTOON_GUESS_STORE=assets/leaderboard.sqlite (see cartoon_guess_storage.py)
  - Works on Windows / Mac / Linux / Android (Pydroid or Termux)
+ - Buffered ANSI console rendering (see cartoon_guess_render.py);
+   set CARTOON_RENDER_STATS=1 to print bytes/time per frame on exit
 """
 
-import random, time, os, sys, json, platform
+import random, time, os, sys, platform, threading
 from datetime import datetime
 
+from cartoon_guess_daily import ROUNDS_PER_DAY, DailyProgress, YearSchedule, today
+from cartoon_guess_hints import HintEngine
+from cartoon_guess_render import ConsoleRenderer
+from cartoon_guess_storage import open_store
+from cartoon_guess_rules import (LEVELS, HINTS_PER_ROUND, base_score, apply_miss,
+                                 apply_hint, speed_bonus)
+
 # -------------------------
 # Config / Assets location
 # -------------------------
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 SOUNDS_DIR = os.path.join(ASSETS_DIR, "sounds")
-LEADERBOARD_FILE = os.path.join(ASSETS_DIR, "leaderboard.json")
 
 # Ensure assets dir exists
 os.makedirs(SOUNDS_DIR, exist_ok=True)
 os.makedirs(ASSETS_DIR, exist_ok=True)
 
+# All console output goes through one buffered renderer (one write per frame)
+screen = ConsoleRenderer()
+
 # -------------------------
 # Sound handling
 # -------------------------
@@ -53,64 +68,83 @@ except Exception:
     else:
         SOUND_BACKEND = None  # no sound backend
 
+_pygame_sounds = {}
+_pygame_sounds_lock = threading.Lock()
+PRELOAD_ORDER = ('start', 'pop', 'hint', 'win', 'lose')  # roughly the order a round needs them
+
+def _pygame_sound(key, path):
+    # wav file if the player provided one, else the built-in synthesised sound; cached either way
+    with _pygame_sounds_lock:
+        if key not in _pygame_sounds:
+            if path and os.path.exists(path):
+                _pygame_sounds[key] = pygame.mixer.Sound(path)
+            else:
+                from cartoon_guess_sounds import make_pygame_sound
+                _pygame_sounds[key] = make_pygame_sound(pygame, key)
+        return _pygame_sounds[key]
+
+def _preload_sounds():
+    for key in PRELOAD_ORDER:
+        try:
+            _pygame_sound(key, SOUND_FILES.get(key))
+        except Exception:
+            pass
+
+if SOUND_BACKEND == 'pygame':
+    # load / synthesise the pack while the player is still at the name prompt,
+    # so no round waits on it
+    threading.Thread(target=_preload_sounds, name="sound-preload", daemon=True).start()
+
 def play_sound(key):
     """Play a short sound if available and backend present."""
     path = SOUND_FILES.get(key)
-    if not path or not os.path.exists(path):
-        return
     try:
+        # flush only when a sound will play, so its feedback line is on screen first;
+        # without sound the line waits for the next prompt (one write per frame)
         if SOUND_BACKEND == 'pygame':
-            snd = pygame.mixer.Sound(path)
-            snd.play()
+            snd = _pygame_sound(key, path)
+            if snd is not None:
+                screen.flush()
+                snd.play()
         elif SOUND_BACKEND == 'winsound':
-            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+            if path and os.path.exists(path):
+                screen.flush()
+                winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
     except Exception:
         pass
 
 # -------------------------
 # Leaderboard utilities
 # -------------------------
-def load_leaderboard():
-    if not os.path.exists(LEADERBOARD_FILE):
-        return []
-    try:
-        with open(LEADERBOARD_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return []
+# JSON file by default (keeps top 50), SQLite if CARTOON_GUESS_STORE points at a .sqlite/.db
+STORE = open_store()
 
-def save_leaderboard_table(table):
-    try:
-        with open(LEADERBOARD_FILE, 'w', encoding='utf-8') as f:
-            json.dump(table, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+def load_leaderboard(limit=50):
+    # sorted by score desc then time asc
+    return STORE.top(limit)
 
 def add_score_to_leaderboard(name, score, time_taken):
-    table = load_leaderboard()
     entry = {
         "name": name,
         "score": score,
         "time": time_taken,
         "when": datetime.utcnow().isoformat() + "Z"
     }
-    table.append(entry)
-    # Sort by score desc then time asc
-    table = sorted(table, key=lambda e: (-e['score'], e['time']))
-    # Keep top 50 for storage, but show top 10
-    table = table[:50]
-    save_leaderboard_table(table)
+    try:
+        STORE.add(entry)
+    except Exception as e:
+        screen.line("Could not save leaderboard:", e)
 
 def show_leaderboard(top_n=10):
-    table = load_leaderboard()
+    table = load_leaderboard(top_n)
     if not table:
-        print("\n🏆 Leaderboard empty — be the first!\n")
+        screen.line("\n🏆 Leaderboard empty — be the first!\n")
         return
-    print("\n🏆 Leaderboard (Top {}) 🏆".format(top_n))
+    screen.line("\n🏆 Leaderboard (Top {}) 🏆".format(top_n))
     for i, e in enumerate(table[:top_n], start=1):
         when = e.get('when','')
-        print(f"{i:2d}. {e['name']:<12s}  Score: {e['score']:3d}  Time: {e['time']:3d}s  At:{when}")
-    print()
+        screen.line(f"{i:2d}. {e['name']:<12s}  Score: {e['score']:3d}  Time: {e['time']:3d}s  At:{when}")
+    screen.line()
 
 # -------------------------
 # Game variables
@@ -122,41 +156,33 @@ CHARACTERS = {
     '4': ("Dino", "🦖", "Roar! Try not to be eaten by wrong guesses.")
 }
 
-LEVELS = {
-    '1': ("Easy", 10, 6),
-    '2': ("Medium", 50, 7),
-    '3': ("Hard", 100, 9)
-}
-
 # -------------------------
 # Helpers
 # -------------------------
 def input_int(prompt, min_val=None, max_val=None):
     while True:
-        s = input(prompt).strip()
+        s = screen.ask(prompt).strip()
         try:
             v = int(s)
             if min_val is not None and v < min_val:
-                print(f"Please enter >= {min_val}")
+                screen.line(f"Please enter >= {min_val}")
                 continue
             if max_val is not None and v > max_val:
-                print(f"Please enter <= {max_val}")
+                screen.line(f"Please enter <= {max_val}")
                 continue
             return v
         except ValueError:
-            print("Please enter a valid integer.")
+            screen.line("Please enter a valid integer.")
 
 def clear_console():
-    if platform.system() == "Windows":
-        os.system('cls')
-    else:
-        os.system('clear')
+    # ANSI home+clear queued into the next frame; no shell subprocess
+    screen.clear()
 
 # -------------------------
 # Game Flow
 # -------------------------
 def ascii_title():
-    print(r"""
+    screen.line(r"""
   ____                _                  _   _                  
  / ___|___  _ __  ___| |_ _ __ ___  __ _| |_(_) ___  _ __  ___ 
 | |   / _ \| '_ \/ __| __| '__/ _ \/ _` | __| |/ _ \| '_ \/ __|
@@ -165,118 +191,162 @@ def ascii_title():
                                                                 
     Cartoon Number Guessing — Full Edition
     """)
-    print("Cute Cartoon Sound Pack selected 🎵 (place files in assets/sounds/ if you want real sounds)")
-    print()
+    screen.line("Cute Cartoon Sound Pack built in 🎵 (wav files in assets/sounds/ replace it)")
+    screen.line()
 
 def choose_character():
-    print("Choose your character:")
+    screen.line("Choose your character:")
     for k, (name, emoji, tag) in CHARACTERS.items():
-        print(f" {k}) {emoji}  {name} — {tag}")
-    choice = input("Pick 1-4 (default 1): ").strip()
+        screen.line(f" {k}) {emoji}  {name} — {tag}")
+    choice = screen.ask("Pick 1-4 (default 1): ").strip()
     if choice not in CHARACTERS:
         choice = '1'
     name, emoji, tag = CHARACTERS[choice]
-    print(f"Great — you are {emoji} {name}! {tag}\n")
+    screen.line(f"Great — you are {emoji} {name}! {tag}\n")
     return choice
 
 def choose_level():
-    print("Choose level:")
+    screen.line("Choose level:")
     for k, (label, rng, tries) in LEVELS.items():
-        print(f" {k}) {label} (1..{rng}, {tries} tries)")
-    choice = input("Pick 1-3 (default 1): ").strip()
+        screen.line(f" {k}) {label} (1..{rng}, {tries} tries)")
+    choice = screen.ask("Pick 1-3 (default 1): ").strip()
     if choice not in LEVELS:
         choice = '1'
     return choice
 
-def give_hint(secret, limit, hint_count_used):
-    # three hint types rotating by usage
-    t = hint_count_used % 3
-    if t == 0:
-        spread = max(1, int(limit * 0.12))
-        low = max(1, secret - spread)
-        high = min(limit, secret + spread)
-        return f"It's between {low} and {high}."
-    elif t == 1:
-        if secret % 5 == 0:
-            return "It's divisible by 5."
-        if secret % 2 == 0:
-            return "It's even."
-        return "It's odd."
-    else:
-        low = max(1, secret - 5)
-        high = min(limit, secret + 5)
-        return f"It's within {low} and {high}."
+def give_hint(hints):
+    # best hint for the candidates still left after previous guesses/hints
+    return hints.give()
 
-def play_round(player_name, char_choice, level_choice, leaderboard_enabled=True):
+def play_round(player_name, char_choice, level_choice, leaderboard_enabled=True, secret=None,
+               daily=None):
+    # daily: a DailyProgress; the result is logged there instead of the leaderboard
     level_name, rng, max_attempts = LEVELS[level_choice]
-    secret = random.randint(1, rng)
+    if secret is None:
+        secret = random.randint(1, rng)
     attempts_left = max_attempts
-    score = 100 + ( (3 - int(level_choice)) * 10 )  # higher base for easier levels
+    score = base_score(level_choice)
     hint_uses = 0
+    guesses = []
+    hints = HintEngine(secret, rng)
     start_time = time.time()
     play_sound('start')
 
-    print(f"\n🎯 {CHARACTERS[char_choice][1]}  {CHARACTERS[char_choice][0]} — Level {level_name}")
-    print(f"Guess a number between 1 and {rng}. You have {attempts_left} attempts. (Type 'hint' to use a hint)\n")
+    screen.line(f"\n🎯 {CHARACTERS[char_choice][1]}  {CHARACTERS[char_choice][0]} — Level {level_name}")
+    screen.line(f"Guess a number between 1 and {rng}. You have {attempts_left} attempts. (Type 'hint' to use a hint)\n")
 
     while attempts_left > 0:
-        s = input(f"Attempt ({attempts_left}) > ").strip().lower()
+        s = screen.ask(f"Attempt ({attempts_left}) > ").strip().lower()
         if s == 'hint':
-            if hint_uses >= 3:
-                print("No hints left for this round.")
+            if hint_uses >= HINTS_PER_ROUND:
+                screen.line("No hints left for this round.")
                 continue
-            hint_text = give_hint(secret, rng, hint_uses)
-            hint_uses += 1
-            score = max(0, score - 8)
-            print("💡 Hint:", hint_text)
+            hint_text, informative = give_hint(hints)
+            if informative:
+                hint_uses += 1
+                score = apply_hint(score)
+                screen.line("💡 Hint:", hint_text)
+            else:
+                screen.line("💡", hint_text, "(no hint used)")
             play_sound('hint')
             continue
         try:
             guess = int(s)
         except ValueError:
-            print("Enter an integer or 'hint'.")
+            screen.line("Enter an integer or 'hint'.")
             continue
+        guesses.append(guess)
 
         if guess == secret:
             elapsed = int(time.time() - start_time)
-            bonus = max(10, 60 - elapsed)  # reward speed
+            bonus = speed_bonus(elapsed)
             final_score = max(0, score + bonus)
-            print(f"\n🎉 Correct! You found it in {int(time.time()-start_time)}s. +{bonus} speed bonus.")
+            screen.line(f"\n🎉 Correct! You found it in {int(time.time()-start_time)}s. +{bonus} speed bonus.")
             play_sound('win')
-            if leaderboard_enabled:
+            if daily is not None:
+                record_daily_result(daily, player_name, guesses, hint_uses,
+                                    int(time.time() - start_time), final_score, True)
+            elif leaderboard_enabled:
                 add_score_to_leaderboard(player_name, final_score, int(time.time() - start_time))
             return final_score, True
         elif guess < secret:
-            print("⬆️ Too low!")
+            screen.line("⬆️ Too low!")
             play_sound('pop')
         else:
-            print("⬇️ Too high!")
+            screen.line("⬇️ Too high!")
             play_sound('pop')
+        hints.observe(guess)
         attempts_left -= 1
-        score = max(0, score - 10)
+        score = apply_miss(score)
 
     # if we exit loop, player lost this round
-    print(f"\n💥 Out of attempts! The number was {secret}.")
+    screen.line(f"\n💥 Out of attempts! The number was {secret}.")
     play_sound('lose')
-    if leaderboard_enabled:
+    if daily is not None:
+        record_daily_result(daily, player_name, guesses, hint_uses,
+                            int(time.time() - start_time), 0, False)
+    elif leaderboard_enabled:
         add_score_to_leaderboard(player_name, 0, int(time.time() - start_time))
     return 0, False
 
+def record_daily_result(daily, name, guesses, hints_used, time_taken, score, won):
+    try:
+        daily.finish(name, guesses, hints_used, time_taken, score, won)
+    except Exception as e:
+        screen.line("Could not save daily result:", e)
+
+def daily_challenge(player_name):
+    day = today()
+    schedule = YearSchedule.load(day.year)
+    screen.line(f"\n📅 Daily Challenge {day.isoformat()} — same numbers for everyone today!")
+    char_choice = choose_character()
+    level_choice = choose_level()
+    # progress is kept on disk, so quitting and restarting resumes instead of replaying
+    progress = DailyProgress(day, level_choice)
+    if progress.next_round() is None:
+        screen.line(f"Today's {LEVELS[level_choice][0]} challenge is over (total score "
+                    f"{progress.total_score()}). Come back tomorrow!")
+        return
+    if progress.started:
+        screen.line(f"Resuming at round {progress.started + 1} (score so far {progress.total_score()}).")
+    while True:
+        try:
+            round_no = progress.begin()
+        except Exception as e:
+            # without the start record a restart could replay this secret, so don't play it
+            screen.line("Could not save daily progress:", e)
+            break
+        screen.line(f"\nDaily round {round_no}/{ROUNDS_PER_DAY}")
+        secret = schedule.secret(day, level_choice, round_no)
+        sc, won = play_round(player_name, char_choice, level_choice, secret=secret, daily=progress)
+        total_score = progress.total_score()
+        screen.line(f"\nDaily round {round_no} ended. Round score: {sc}. Total score: {total_score}")
+        if not won:
+            screen.line("You lost the round. Come back tomorrow for a new challenge!")
+            break
+        if progress.next_round() is None:
+            screen.line(f"\n🏅 You cleared today's challenge! Total score: {total_score}")
+            break
+        cont = screen.ask("Continue to the next daily round? (y/n): ").strip().lower()
+        if cont != 'y':
+            break
+
 # -------------------------
 # Main menu
 # -------------------------
 def main_menu():
     clear_console()
     ascii_title()
-    player_name = input("Player name (leave blank to use 'Player'): ").strip() or "Player"
+    player_name = screen.ask("Player name (leave blank to use 'Player'): ").strip() or "Player"
     while True:
-        print("\nMain Menu")
-        print(" 1) Play Game")
-        print(" 2) View Leaderboard")
-        print(" 3) Install / Manage Sounds (info)")
-        print(" 4) Credits / Help")
-        print(" 5) Quit")
-        choice = input("Choose 1-5: ").strip()
+        screen.line("\nMain Menu")
+        screen.line(" 1) Play Game")
+        screen.line(" 2) Daily Challenge")
+        screen.line(" 3) View Leaderboard")
+        screen.line(" 4) Install / Manage Sounds (info)")
+        screen.line(" 5) Credits / Help")
+        screen.line(" 6) Quit")
+        choice = screen.ask("Choose 1-6: ").strip()
         if choice == '1':
             char_choice = choose_character()
             level_choice = choose_level()
@@ -287,35 +357,46 @@ def main_menu():
                 sc, won = play_round(player_name, char_choice, level_choice)
                 total_score += sc
                 rounds += 1
-                print(f"\nRound {rounds} ended. Round score: {sc}. Total score: {total_score}")
+                screen.line(f"\nRound {rounds} ended. Round score: {sc}. Total score: {total_score}")
                 if not won:
-                    print("You lost the round. Returning to main menu.")
+                    screen.line("You lost the round. Returning to main menu.")
                     break
-                cont = input("Continue next round at same level? (y/n): ").strip().lower()
+                cont = screen.ask("Continue next round at same level? (y/n): ").strip().lower()
                 if cont != 'y':
                     break
-            print("\nReturning to main menu...")
+            screen.line("\nReturning to main menu...")
+            screen.flush()
             time.sleep(1.2)
         elif choice == '2':
-            show_leaderboard(10)
+            daily_challenge(player_name)
+            screen.line("\nReturning to main menu...")
+            screen.flush()
+            time.sleep(1.2)
         elif choice == '3':
-            print("\nSound files can be placed in:", SOUNDS_DIR)
-            print("Expected (cute pack) filenames (optional):")
-            for k, v in SOUND_FILES.items():
-                print(" -", os.path.basename(v))
-            print("Game will try pygame -> winsound -> silent fallback.")
-            input("\nPress Enter to return.")
+            show_leaderboard(10)
         elif choice == '4':
-            print("\nCartoon Guess Game — Help\n - Type 'hint' during a round to use one of 3 hints.\n - Leaderboard stores last scores.\n - To enable sounds: install pygame (pip install pygame) and place wav files in assets/sounds/.\n - Works in Pydroid / Termux; use Python3.\n")
-            input("Press Enter to return.")
+            screen.line("\nSound files can be placed in:", SOUNDS_DIR)
+            screen.line("Built-in sounds are used for any file that is missing.")
+            screen.line("Expected (cute pack) filenames (optional):")
+            for k, v in SOUND_FILES.items():
+                screen.line(" -", os.path.basename(v))
+            screen.line("Game will try pygame -> winsound -> silent fallback.")
+            screen.ask("\nPress Enter to return.")
         elif choice == '5':
-            print("Bye! Play again soon 🐱")
+            screen.line("\nCartoon Guess Game — Help\n - Type 'hint' during a round to use one of 3 hints.\n - Leaderboard stores last scores.\n - To enable sounds: install pygame (pip install pygame) and optionally place wav files in assets/sounds/.\n - Works in Pydroid / Termux; use Python3.\n")
+            screen.ask("Press Enter to return.")
+        elif choice == '6':
+            screen.line("Bye! Play again soon 🐱")
             break
         else:
-            print("Invalid choice. Pick 1-5.")
+            screen.line("Invalid choice. Pick 1-6.")
 
 if __name__ == '__main__':
     try:
         main_menu()
     except KeyboardInterrupt:
-        print("\nGoodbye!")
\ No newline at end of file
+        screen.line("\nGoodbye!")
+    finally:
+        screen.flush()
+        if os.environ.get("CARTOON_RENDER_STATS"):
+            sys.stderr.write("render: " + screen.stats.summary() + "\n")
\ No newline at end of file
@@ -3,11 +3,15 @@ Cartoon / Fun Themed Number Guessing Game (Tkinter)
 Features:
 - Cartoon-themed GUI with animations
 - 3 difficulty levels (Easy/Medium/Hard)
-- Timer-based scoring
-- Leaderboard saved to leaderboard.txt
+- Timer-based scoring (shared rules in cartoon_guess_rules)
+- Leaderboard shared with the other editions (cartoon_guess_storage: leaderboard.json,
+  or SQLite via CARTOON_GUESS_STORE)
 - Sound effects (optional, uses pygame)
-- Hints Power-Ups (3 per game): range hint, parity/divisibility hint, +/-5 proximity hint
+- Hints Power-Ups (3 per game): the most informative hint for what your guesses left open
+  (same hint engine as the other editions, cartoon_guess_hints)
 - Replay option
+- Daily challenge: same secrets for everyone on the same (UTC) day; results are logged
+  in assets/daily/ (cartoon_guess_daily) instead of the leaderboard
 
 Run instructions:
 - Install dependencies if you want sound: pip install pygame
@@ -22,6 +26,13 @@ import random
 import time
 import threading
 import os
+from datetime import datetime
+
+from cartoon_guess_storage import open_store
+from cartoon_guess_rules import (LEVELS, HINTS_PER_ROUND, base_score, apply_miss,
+                                 apply_hint, final_score)
+from cartoon_guess_hints import HintEngine
+from cartoon_guess_daily import ROUNDS_PER_DAY, DailyProgress, daily_secret, today
 
 # Try to import pygame for sounds, if available
 try:
@@ -31,7 +42,7 @@ try:
 except Exception:
     SOUND_AVAILABLE = False
 
-LEADERBOARD_FILE = "leaderboard.txt"
+STORE = open_store()
 
 # --- Utility functions ---
 
@@ -44,20 +55,21 @@ def play_sound(path):
         pass
 
 
-def save_score(name, score):
+def save_score(name, score, time_taken=0):
+    entry = {"name": name, "score": score, "time": time_taken,
+             "when": datetime.utcnow().isoformat() + "Z"}
     try:
-        with open(LEADERBOARD_FILE, "a", encoding="utf-8") as f:
-            f.write(f"{name} - {score}\n")
+        STORE.add(entry)
     except Exception as e:
         print("Could not save leaderboard:", e)
 
 
-def read_leaderboard():
-    if not os.path.exists(LEADERBOARD_FILE):
+def read_leaderboard(limit=15):
+    try:
+        table = STORE.top(limit)
+    except Exception:
         return []
-    with open(LEADERBOARD_FILE, "r", encoding="utf-8") as f:
-        lines = [l.strip() for l in f.readlines() if l.strip()]
-    return lines
+    return [f"{e['name']} - {e['score']} ({e.get('time', 0)}s)" for e in table]
 
 # --- Main App ---
 
@@ -80,6 +92,9 @@ class CartoonGuessGame(tk.Tk):
         self.start_time = None
         self.hints_left = 3
         self.game_active = False
+        self.daily = None  # DailyProgress while playing a daily round
+        self.guesses = []
+        self.hints = None
 
         # Build UI
         self._build_header()
@@ -129,6 +144,8 @@ class CartoonGuessGame(tk.Tk):
         ttk.Radiobutton(right, text="Easy (1-10)", variable=self.level_var, value=1).pack(anchor="w")
         ttk.Radiobutton(right, text="Medium (1-50)", variable=self.level_var, value=2).pack(anchor="w")
         ttk.Radiobutton(right, text="Hard (1-100)", variable=self.level_var, value=3).pack(anchor="w")
+        self.daily_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(right, text="Daily challenge 📅", variable=self.daily_var).pack(anchor="w", pady=(4,0))
 
         start_btn = tk.Button(right, text="Start Game ▶", command=self.start_game, bg="#FFDE59")
         start_btn.pack(fill="x", pady=(12,6))
@@ -177,23 +194,31 @@ class CartoonGuessGame(tk.Tk):
             self.player_name = "Player"
 
         self.level = self.level_var.get()
-        if self.level == 1:
-            self.limit = 10
-            self.max_attempts = 6
-        elif self.level == 2:
-            self.limit = 50
-            self.max_attempts = 7
+        _, self.limit, self.max_attempts = LEVELS[str(self.level)]
+
+        started_text = f"Level {self.level} started! Guess between 1 and {self.limit}."
+        self.daily = None
+        if self.daily_var.get():
+            day = today()
+            daily = DailyProgress(day, str(self.level))
+            round_no = daily.begin()
+            if round_no is None:
+                messagebox.showinfo("Daily challenge", f"Today's challenge for this level is over "
+                                    f"(total score {daily.total_score()}). Come back tomorrow!")
+                return
+            self.daily = daily
+            self.secret = daily_secret(day, str(self.level), round_no)
+            started_text = f"📅 Daily {day.isoformat()} round {round_no}/{ROUNDS_PER_DAY}! Guess between 1 and {self.limit}."
         else:
-            self.limit = 100
-            self.max_attempts = 9
-
-        self.secret = random.randint(1, self.limit)
+            self.secret = random.randint(1, self.limit)
+        self.guesses = []
+        self.hints = HintEngine(self.secret, self.limit)
         self.attempts_left = self.max_attempts
-        self.hints_left = 3
-        self.score = 200 - (self.level * 20)
+        self.hints_left = HINTS_PER_ROUND
+        self.score = base_score(str(self.level))
         self.start_time = time.time()
         self.game_active = True
-        self.msg_label.config(text=f"Level {self.level} started! Guess between 1 and {self.limit}.")
+        self.msg_label.config(text=started_text)
         self._update_info()
         self._prompt_for_guess()
         play_sound_if_available('start.wav')
@@ -223,36 +248,52 @@ class CartoonGuessGame(tk.Tk):
     def _handle_guess(self, guess):
         if not self.game_active:
             return
+        self.guesses.append(guess)
         if guess == self.secret:
             time_taken = int(time.time() - self.start_time)
-            gained = max(30, self.score - time_taken)
-            total = gained
-            self.msg_label.config(text=f"🎉 {self.player_name}, you guessed it! +{gained} pts")
+            total = final_score(self.score, time_taken)
+            self.msg_label.config(text=f"🎉 {self.player_name}, you guessed it! +{total} pts")
             play_sound_if_available('win.wav')
             self._celebrate()
-            save_score(self.player_name, total)
+            self._record(total, int(time.time() - self.start_time), True)
             self._ask_play_again()
             self.game_active = False
             return
         else:
+            self.hints.observe(guess)
             self.attempts_left -= 1
             hint = "⬆️ Higher!" if guess < self.secret else "⬇️ Lower!"
             self.msg_label.config(text=hint)
             play_sound_if_available('pop.wav')
-            self.score -= 10
+            self.score = apply_miss(self.score)
             self._update_info()
 
             if self.attempts_left <= 0:
-                self.msg_label.config(text=f"💥 Out of attempts! The number was {self.secret}")
+                text = f"💥 Out of attempts! The number was {self.secret}"
+                if self.daily is not None:
+                    text += "\nToday's daily challenge is over — come back tomorrow!"
+                self.msg_label.config(text=text)
                 play_sound_if_available('lose.wav')
                 self.game_active = False
-                save_score(self.player_name, 0)
+                self.score = 0
+                self._record(0, int(time.time() - self.start_time), False)
                 self._ask_play_again()
                 return
 
             # continue prompting
             self._prompt_for_guess()
 
+    def _record(self, score, time_taken, won):
+        # daily rounds go to the daily log (with guesses, for verification), others to the leaderboard
+        if self.daily is None:
+            save_score(self.player_name, score, time_taken)
+            return
+        try:
+            self.daily.finish(self.player_name, self.guesses, HINTS_PER_ROUND - self.hints_left,
+                              time_taken, score, won)
+        except Exception as e:
+            print("Could not save daily result:", e)
+
     def _update_info(self):
         elapsed = int(time.time() - self.start_time) if self.start_time else 0
         self.info_label.config(text=f"Score: {self.score}\nTimer: {elapsed}s\nAttempts: {self.attempts_left}\nHints: {self.hints_left}")
@@ -267,30 +308,13 @@ class CartoonGuessGame(tk.Tk):
             messagebox.showinfo("No hints", "You have used all hints for this level.")
             return
 
-        # choose hint type based on hints left or randomly
-        hint_type = (4 - self.hints_left) % 3  # cycles through 0,1,2
-        text = ""
-        if hint_type == 0:
-            # range hint +/-10%
-            spread = max(1, int(self.limit * 0.1))
-            low = max(1, self.secret - spread)
-            high = min(self.limit, self.secret + spread)
-            text = f"It's between {low} and {high}!"
-        elif hint_type == 1:
-            # divisibility / parity
-            if self.secret % 5 == 0:
-                text = "It's divisible by 5!"
-            elif self.secret % 2 == 0:
-                text = "It's an even number!"
-            else:
-                text = "It's an odd number!"
-        else:
-            # proximity hint +/-5
-            low = max(1, self.secret - 5)
-            high = min(self.limit, self.secret + 5)
-            text = f"It's within {low} and {high}"
-
+        # best hint for the candidates still left after previous guesses/hints
+        text, informative = self.hints.give()
+        if not informative:
+            self.msg_label.config(text=f"💡 {text} (no hint used)")
+            return
         self.hints_left -= 1
+        self.score = apply_hint(self.score)
         self.msg_label.config(text=f"💡 Hint: {text}")
         self._update_info()
         play_sound_if_available('hint.wav')
@@ -311,8 +335,8 @@ class CartoonGuessGame(tk.Tk):
         if not lines:
             messagebox.showinfo("Leaderboard", "No scores yet. Be the first!")
             return
-        text = "\n".join(lines[-15:][::-1])  # show last 15 entries newest-first
-        messagebox.showinfo("Leaderboard (latest)", text)
+        text = "\n".join(f"{i}. {line}" for i, line in enumerate(lines, start=1))
+        messagebox.showinfo("Leaderboard (Top 15)", text)
 
     # --- Animations ---
     def _floating_animation(self):
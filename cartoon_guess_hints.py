@@ -0,0 +1,165 @@
+# cartoon_guess_hints.py
+"""
+Hint engine for the Cartoon Number Guessing Game.
+ - Tracks which numbers 1..limit are still possible in a round
+   (interval from "Too low / Too high" + a bitset for everything else)
+ - Every guess is an O(1) interval update; every hint is one AND over the bitset
+ - On each request all hints in the catalogue are scored and the one that rules out
+   the most remaining candidates is given
+ - The catalogue is a plain list of functions, so new hint types are easy to plug in
+
+Run `python cartoon_guess_hints.py` for a quick speed check on a large range.
+"""
+
+from functools import lru_cache
+
+# -------------------------
+# Bitset helpers (bit i <=> number i)
+# -------------------------
+def range_mask(low, high):
+    """Numbers low..high inclusive."""
+    if high < low:
+        return 0
+    return ((1 << (high - low + 1)) - 1) << low
+
+
+@lru_cache(maxsize=64)
+def multiples_mask(step, limit, offset=0):
+    """Numbers n in 1..limit with n % step == offset, built without a Python loop."""
+    start = offset if offset > 0 else step
+    if start > limit:
+        return 0
+    count = (limit - start) // step + 1
+    # 1 + 2^step + 2^(2*step) + ... (count terms) = (2^(step*count) - 1) / (2^step - 1)
+    repeated = ((1 << (step * count)) - 1) // ((1 << step) - 1)
+    return repeated << start
+
+
+if hasattr(int, "bit_count"):
+    def popcount(bits):
+        return bits.bit_count()
+else:  # Python < 3.10 (older Pydroid builds)
+    def popcount(bits):
+        return bin(bits).count("1")
+
+# -------------------------
+# Hint catalogue
+# Each hint takes the engine and returns (text, mask) where mask is the set of
+# numbers the statement is true for. Statements must always be true for the secret.
+# -------------------------
+def range_hint(engine):
+    spread = max(1, int(engine.limit * 0.12))
+    low = max(1, engine.secret - spread)
+    high = min(engine.limit, engine.secret + spread)
+    return f"It's between {low} and {high}.", range_mask(low, high)
+
+
+def proximity_hint(engine):
+    low = max(1, engine.secret - 5)
+    high = min(engine.limit, engine.secret + 5)
+    return f"It's within {low} and {high}.", range_mask(low, high)
+
+
+def parity_hint(engine):
+    if engine.secret % 2 == 0:
+        return "It's even.", multiples_mask(2, engine.limit)
+    return "It's odd.", multiples_mask(2, engine.limit, 1)
+
+
+def divisible_by_5_hint(engine):
+    fives = multiples_mask(5, engine.limit)
+    if engine.secret % 5 == 0:
+        return "It's divisible by 5.", fives
+    return "It's not divisible by 5.", range_mask(1, engine.limit) & ~fives
+
+
+def divisible_by_3_hint(engine):
+    threes = multiples_mask(3, engine.limit)
+    if engine.secret % 3 == 0:
+        return "It's divisible by 3.", threes
+    return "It's not divisible by 3.", range_mask(1, engine.limit) & ~threes
+
+
+def half_hint(engine):
+    # splits what is left of the current interval in two
+    mid = (engine.low + engine.high) // 2
+    if engine.secret <= mid:
+        return f"It's {mid} or lower.", range_mask(1, mid)
+    return f"It's higher than {mid}.", range_mask(mid + 1, engine.limit)
+
+
+DEFAULT_HINTS = [
+    range_hint,
+    parity_hint,
+    proximity_hint,
+    divisible_by_5_hint,
+    divisible_by_3_hint,
+    half_hint,
+]
+
+# -------------------------
+# Engine
+# -------------------------
+class HintEngine:
+    """Candidate set for one round plus the logic to pick the most useful hint."""
+
+    def __init__(self, secret, limit, catalogue=None):
+        self.secret = secret
+        self.limit = limit
+        self.catalogue = list(DEFAULT_HINTS if catalogue is None else catalogue)
+        self.low = 1
+        self.high = limit
+        self.bits = range_mask(1, limit)  # constraints learned from hints
+
+    def observe(self, guess):
+        """Record a wrong guess ("Too low" / "Too high")."""
+        if guess < self.secret:
+            self.low = max(self.low, guess + 1)
+        elif guess > self.secret:
+            self.high = min(self.high, guess - 1)
+
+    def candidates(self):
+        return self.bits & range_mask(self.low, self.high)
+
+    def remaining(self):
+        return popcount(self.candidates())
+
+    def rank(self):
+        """[(removed, text, mask)] for every hint, most informative first."""
+        cand = self.candidates()
+        total = popcount(cand)
+        scored = []
+        for i, hint in enumerate(self.catalogue):
+            text, mask = hint(self)
+            scored.append((total - popcount(cand & mask), -i, text, mask))
+        scored.sort(reverse=True)
+        return [(removed, text, mask) for removed, _, text, mask in scored]
+
+    def give(self):
+        """Pick the best hint, apply it to the candidate set and return (text, informative).
+        informative is False when no hint rules anything out; callers don't charge for those."""
+        if not self.catalogue:
+            return "No hints available.", False
+        removed, text, mask = self.rank()[0]
+        if removed == 0:
+            return f"Nothing new to tell — it's already narrowed to {self.low}..{self.high}.", False
+        self.bits &= mask
+        # tighten the interval to the remaining candidates
+        cand = self.candidates()
+        if cand:
+            self.low = (cand & -cand).bit_length() - 1
+            self.high = cand.bit_length() - 1
+        return text, True
+
+
+if __name__ == '__main__':
+    import random, time
+    for limit in (100, 10_000, 1_000_000):
+        secret = random.randint(1, limit)
+        engine = HintEngine(secret, limit)
+        engine.observe(max(1, secret // 2))
+        t0 = time.perf_counter()
+        ranked = engine.rank()
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"limit {limit:>9,}: {len(ranked)} hints ranked in {ms:.2f} ms, "
+              f"best removes {ranked[0][0]:,} of {engine.remaining():,} -> {ranked[0][1]}")
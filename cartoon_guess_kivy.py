@@ -2,16 +2,62 @@
 """
 Kivy GUI starter for Cartoon Number Guessing Game
 Simple UI: character selection, level, start round, input guess, show hints and leaderboard popup
+Leaderboard is opened, loaded into memory and saved by a background thread, so the UI
+thread never touches the disk for it (frame times are logged around each save).
+Startup path: KV rules are parsed once per process, leaderboard/disk work is deferred until
+after the first frame, and a startup timeline (process, imports, build, first frame) is logged.
+Daily toggle: rounds use the day's shared secrets (cartoon_guess_daily) instead of random ones;
+their results go to the daily log in assets/daily/ rather than the leaderboard.
+Scoring follows the shared rules (cartoon_guess_rules).
 """
+import bisect, os, random, threading, time
+from datetime import datetime
+
+# -------------------------
+# Startup timeline
+# -------------------------
+def _process_age():
+    """Seconds since the OS started this process (Linux/Android /proc), else 0."""
+    try:
+        with open('/proc/self/stat', 'rb') as f:
+            fields = f.read().rsplit(b')', 1)[1].split()
+        with open('/proc/uptime', 'rb') as f:
+            uptime = float(f.read().split()[0])
+        # field 22 (starttime) is the 20th after the ')' of comm, in clock ticks since boot
+        return max(0.0, uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK'))
+    except Exception:
+        return 0.0
+
+_T0 = time.perf_counter()
+STARTUP = [("process", _T0 - _process_age())]
+
+def mark(label):
+    STARTUP.append((label, time.perf_counter()))
+
+def startup_report():
+    parts = []
+    for (_, prev), (label, t) in zip(STARTUP, STARTUP[1:]):
+        parts.append(f"{label} +{(t - prev) * 1000:.0f} ms")
+    total = (STARTUP[-1][1] - STARTUP[0][1]) * 1000
+    return ", ".join(parts) + f" (time-to-interactive {total:.0f} ms)"
+
+mark("module")
+
 from kivy.app import App
 from kivy.lang import Builder
+from kivy.factory import Factory
 from kivy.clock import Clock
+from kivy.logger import Logger
 from kivy.properties import StringProperty, NumericProperty
-import random, os, json, time
-from datetime import datetime
 
+from cartoon_guess_rules import (LEVELS, HINTS_PER_ROUND, base_score, apply_miss,
+                                 apply_hint, final_score)
+
+mark("imports")
+
+# Parsed once per process into a rule; build() only instantiates it.
 KV = '''
-BoxLayout:
+<CartoonGuessRoot@BoxLayout>:
     orientation: 'vertical'
     padding: dp(12)
     spacing: dp(8)
@@ -36,40 +82,43 @@ BoxLayout:
             size_hint_x: 0.3
         TextInput:
             id: name_input
-            text: root.player_name
+            text: app.player_name
             multiline: False
         Label:
             text: "Character:"
         Spinner:
             id: char_spinner
-            text: root.character_text
+            text: app.character_text
             values: ['🐱 Cat','🤖 Robot','🐼 Panda','🦖 Dino']
-            on_text: root.on_character(self.text)
+            on_text: app.on_character(self.text)
         Label:
             text: "Level:"
         Spinner:
             id: level_spinner
             text: 'Easy'
             values: ['Easy','Medium','Hard']
-            on_text: root.on_level(self.text)
+            on_text: app.on_level(self.text)
     BoxLayout:
         size_hint_y: 0.16
         spacing: dp(6)
         Button:
             text: "Start Round"
-            on_release: root.start_round()
+            on_release: app.start_round()
+        ToggleButton:
+            id: daily_toggle
+            text: "Daily"
         Button:
             text: "Hint"
-            on_release: root.use_hint()
+            on_release: app.use_hint()
         Button:
             text: "Leaderboard"
-            on_release: root.show_leaderboard()
+            on_release: app.show_leaderboard()
     BoxLayout:
         size_hint_y: 0.32
         orientation: 'vertical'
         Label:
             id: status_label
-            text: root.status_text
+            text: app.status_text
             halign: 'center'
             valign: 'middle'
             text_size: self.size
@@ -85,18 +134,186 @@ BoxLayout:
             Button:
                 text: "Try!"
                 size_hint_x: 0.4
-                on_release: root.try_guess(guess_input.text)
+                on_release: app.try_guess(guess_input.text)
     Label:
-        text: root.footer_text
+        text: app.footer_text
         size_hint_y: 0.08
         font_size: '12sp'
 '''
+KV_FILENAME = 'cartoon_guess_kivy.kv'
+
+def build_root():
+    """Instantiate the root widget, parsing the KV rules on first use only."""
+    if KV_FILENAME not in Builder.files:
+        Builder.load_string(KV, filename=KV_FILENAME)
+    return Factory.CartoonGuessRoot()
 
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 if not os.path.exists(ASSETS_DIR):
     os.makedirs(ASSETS_DIR)
-LEADERBOARD_FILE = os.path.join(ASSETS_DIR, "leaderboard.json")
+FRAME_BUDGET = 1.0 / 60  # 16 ms
+
+# -------------------------
+# Leaderboard model / persistence
+# -------------------------
+class LeaderboardModel:
+    """In-memory leaderboard, filled once from the store and kept sorted on insert."""
+
+    def __init__(self, keep=50):
+        # storage stays out of the startup imports; by now it is needed anyway
+        from cartoon_guess_storage import rank_key
+        self.rank_key = rank_key
+        self.keep = keep
+        self.entries = []
+        self._keys = []
+        self.loaded = False
+
+    def set_loaded(self, stored):
+        """Install the entries read from the store, keeping scores added while it was read."""
+        added = [e for e in self.entries if e not in stored]
+        self.entries = list(stored)
+        self._keys = [self.rank_key(e) for e in self.entries]
+        self.loaded = True
+        for e in added:
+            self.add(e)
+
+    def add(self, entry):
+        key = self.rank_key(entry)
+        i = bisect.bisect_right(self._keys, key)
+        if i >= self.keep:
+            return False
+        self._keys.insert(i, key)
+        self.entries.insert(i, entry)
+        del self._keys[self.keep:], self.entries[self.keep:]
+        return True
+
+    def top(self, n=10):
+        return self.entries[:n]
+
+class LeaderboardWriter:
+    """Owns the leaderboard store on a worker thread: opens it, loads the model and persists
+    new scores. Scores queued while a write is running go out together as one batch.
+    `on_saved(ok, seconds)` is called back on the Kivy thread via Clock.schedule_once."""
+
+    def __init__(self, open_store, on_saved=None):
+        self.open_store = open_store
+        self.store = None
+        self.on_saved = on_saved
+        self._pending = []
+        self._load = None
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+        self._thread.start()
+
+    def load(self, model, on_loaded=None):
+        """Read the model's entries on the worker; model.set_loaded runs on the Kivy thread."""
+        with self._cond:
+            self._load = (model, on_loaded)
+            self._cond.notify()
+
+    def save(self, entry):
+        with self._cond:
+            self._pending.append(entry)
+            self._cond.notify()
+
+    def flush(self, timeout=2.0):
+        """Block until queued saves are on disk (used when the app stops)."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            if self.store is not None:
+                self.store.close()
+                self.store = None
+
+    def _run(self):
+        try:
+            self.store = self.open_store()
+        except Exception as e:
+            # keep serving jobs: each load/save then fails and is reported like any other error
+            Logger.warning(f"Leaderboard: could not open store: {e}")
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._load)
+                load, self._load = self._load, None
+                batch, self._pending = self._pending, []
+                self._busy = True
+            if load is not None:
+                self._run_load(*load)
+            if batch:
+                self._run_save(batch)
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
 
+    def _run_load(self, model, on_loaded):
+        t0 = time.perf_counter()
+        try:
+            entries = self.store.top(model.keep)
+        except Exception as e:
+            Logger.warning(f"Leaderboard: load failed: {e}")
+            entries = []
+        elapsed = time.perf_counter() - t0
+
+        def install(dt):
+            model.set_loaded(entries)
+            if on_loaded is not None:
+                on_loaded(elapsed)
+        Clock.schedule_once(install, 0)
+
+    def _run_save(self, batch):
+        t0 = time.perf_counter()
+        ok = True
+        try:
+            self.store.add_many(batch)
+        except Exception as e:
+            ok = False
+            Logger.warning(f"Leaderboard: save failed: {e}")
+        elapsed = time.perf_counter() - t0
+        if self.on_saved is not None:
+            Clock.schedule_once(lambda dt, ok=ok, s=elapsed: self.on_saved(ok, s), 0)
+
+class FrameMonitor:
+    """Measures UI-thread frame times between start() and stop()."""
+
+    def __init__(self, budget=FRAME_BUDGET):
+        self.budget = budget
+        self.max_frame = 0.0
+        self.frames = 0
+        self.over_budget = 0
+        self._last = None
+        self._event = None
+
+    def start(self):
+        if self._event is not None:
+            return
+        self.max_frame = 0.0
+        self.frames = 0
+        self.over_budget = 0
+        self._last = time.perf_counter()
+        self._event = Clock.schedule_interval(self._tick, 0)
+
+    def _tick(self, dt):
+        now = time.perf_counter()
+        frame = now - self._last
+        self._last = now
+        self.frames += 1
+        self.max_frame = max(self.max_frame, frame)
+        if frame > self.budget:
+            self.over_budget += 1
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        return self.max_frame
+
+# -------------------------
+# App
+# -------------------------
 class GuessApp(App):
     player_name = StringProperty("Player")
     character_text = StringProperty("🐱 Cat")
@@ -105,12 +322,47 @@ class GuessApp(App):
     secret = NumericProperty(0)
 
     def build(self):
-        self.root = Builder.load_string(KV)
+        mark("app init")
+        self.root = build_root()
         self.hints_left = 3
         self.attempts_left = 0
         self.score = 0
+        self.hints = None
+        self.daily = None  # DailyProgress while playing a daily round
+        self.guesses = []
+        self._leaderboard = None
+        self._writer = None
+        self.frame_monitor = FrameMonitor()
+        mark("build")
+        from kivy.core.window import Window
+        Window.bind(on_flip=self._on_first_frame)
         return self.root
 
+    def _on_first_frame(self, window):
+        window.unbind(on_flip=self._on_first_frame)
+        mark("first frame")
+        Logger.info("Startup: " + startup_report())
+        # warm the leaderboard once the UI is already on screen (read on the writer thread)
+        Clock.schedule_once(lambda dt: self.leaderboard, 0)
+
+    @property
+    def leaderboard(self):
+        if self._leaderboard is None:
+            self._leaderboard = LeaderboardModel()
+            self.writer.load(self._leaderboard, self.on_leaderboard_loaded)
+        return self._leaderboard
+
+    @property
+    def writer(self):
+        if self._writer is None:
+            from cartoon_guess_storage import open_store
+            self._writer = LeaderboardWriter(open_store, on_saved=self.on_leaderboard_saved)
+        return self._writer
+
+    def on_stop(self):
+        if self._writer is not None:
+            self._writer.close()
+
     def on_character(self, text):
         self.character_text = text
 
@@ -122,96 +374,126 @@ class GuessApp(App):
         if name:
             self.player_name = name
         lvl = self.root.ids.level_spinner.text
-        if lvl == 'Easy':
-            rng = 10
-            tries = 6
-        elif lvl == 'Medium':
-            rng = 50
-            tries = 7
+        self.level_choice = {'Easy': '1', 'Medium': '2'}.get(lvl, '3')
+        _, rng, tries = LEVELS[self.level_choice]
+        # first use only; keeps the hint engine and daily tools out of the cold start
+        from cartoon_guess_hints import HintEngine
+        started_text = f"New round started! Guess 1..{rng}"
+        self.daily = None
+        if self.root.ids.daily_toggle.state == 'down':
+            from cartoon_guess_daily import ROUNDS_PER_DAY, DailyProgress, daily_secret, today
+            day = today()
+            daily = DailyProgress(day, self.level_choice)
+            round_no = daily.begin()
+            if round_no is None:
+                self.hints = None
+                self.status_text = (f"📅 Today's {lvl} challenge is over (total {daily.total_score()}). "
+                                    "Come back tomorrow!")
+                return
+            self.daily = daily
+            self.secret = daily_secret(day, self.level_choice, round_no)
+            started_text = f"📅 Daily round {round_no}/{ROUNDS_PER_DAY}! Guess 1..{rng}"
         else:
-            rng = 100
-            tries = 9
-        self.secret = random.randint(1, rng)
+            self.secret = random.randint(1, rng)
+        self.hints = HintEngine(self.secret, rng)
+        self.guesses = []
         self.attempts_left = tries
-        self.hints_left = 3
+        self.hints_left = HINTS_PER_ROUND
         self.start_time = time.time()
-        self.score = 100
-        self.status_text = f"New round started! Guess 1..{rng}"
+        self.score = base_score(self.level_choice)
+        self.status_text = started_text
         self.footer_text = f"Hints: {self.hints_left}   Attempts: {self.attempts_left}"
 
     def use_hint(self):
+        if self.hints is None:
+            self.status_text = "Start a round first!"
+            return
         if self.hints_left <= 0:
             self.status_text = "No hints left!"
             return
-        rng = 10 if self.root.ids.level_spinner.text == 'Easy' else (50 if self.root.ids.level_spinner.text=='Medium' else 100)
-        t = (3 - self.hints_left) % 3
-        if t == 0:
-            spread = max(1, int(rng * 0.12))
-            low = max(1, self.secret - spread)
-            high = min(rng, self.secret + spread)
-            hint = f"It's between {low} and {high}"
-        elif t == 1:
-            hint = "Even" if self.secret % 2 == 0 else "Odd"
+        hint, informative = self.hints.give()
+        if informative:
+            self.hints_left -= 1
+            self.score = apply_hint(self.score)
+            self.status_text = "💡 Hint: " + hint
         else:
-            low = max(1, self.secret - 5)
-            high = min(rng, self.secret + 5)
-            hint = f"Within {low} and {high}"
-        self.hints_left -= 1
-        self.status_text = "💡 Hint: " + hint
+            self.status_text = "💡 " + hint + " (no hint used)"
         self.footer_text = f"Hints: {self.hints_left}   Attempts: {self.attempts_left}"
 
     def try_guess(self, guess_text):
         if not guess_text:
             self.status_text = "Enter a guess!"
             return
+        if self.hints is None:
+            self.status_text = "Start a round first!"
+            return
         try:
             guess = int(guess_text)
         except ValueError:
             self.status_text = "Invalid number."
             return
+        self.guesses.append(guess)
         if guess == self.secret:
             elapsed = int(time.time() - self.start_time)
-            final_score = max(10, self.score + max(0, 60 - elapsed))
-            self.status_text = f"🎉 Correct! Score {final_score}"
-            self.record_score(final_score)
+            total = final_score(self.score, elapsed)
+            self.status_text = f"🎉 Correct! Score {total}"
+            self.end_round(total, elapsed, True)
             return
         elif guess < self.secret:
             self.status_text = "⬆️ Too low!"
         else:
             self.status_text = "⬇️ Too high!"
+        self.hints.observe(guess)
         self.attempts_left -= 1
+        self.score = apply_miss(self.score)
         self.footer_text = f"Hints: {self.hints_left}   Attempts: {self.attempts_left}"
         if self.attempts_left <= 0:
             self.status_text = f"💥 Out of attempts! Number: {self.secret}"
+            if self.daily is not None:
+                self.status_text += "\nToday's daily challenge is over — come back tomorrow!"
+            self.end_round(0, int(time.time() - self.start_time), False)
+
+    def end_round(self, score, elapsed, won):
+        # the round is over: further guesses/hints need a new round
+        self.hints = None
+        if self.daily is None:
+            if won:
+                self.record_score(score, elapsed)
+            return
+        try:
+            self.daily.finish(self.player_name, self.guesses, HINTS_PER_ROUND - self.hints_left,
+                              elapsed, score, won)
+        except Exception as e:
+            Logger.warning(f"Daily: could not save result: {e}")
 
     def show_leaderboard(self):
-        table = []
-        if os.path.exists(LEADERBOARD_FILE):
-            try:
-                with open(LEADERBOARD_FILE, 'r') as f:
-                    table = json.load(f)
-            except:
-                table = []
+        table = self.leaderboard.top(10)
+        if not table and not self.leaderboard.loaded:
+            self.status_text = "Loading leaderboard…"
+            return
         if not table:
             self.status_text = "Leaderboard empty."
             return
-        text = "\\n".join([f"{i+1}. {e['name']} - {e['score']}" for i, e in enumerate(table[:10])])
+        text = "\\n".join([f"{i+1}. {e['name']} - {e['score']}" for i, e in enumerate(table)])
         self.status_text = text
 
-    def record_score(self, score):
-        table = []
-        if os.path.exists(LEADERBOARD_FILE):
-            try:
-                with open(LEADERBOARD_FILE, 'r') as f:
-                    table = json.load(f)
-            except:
-                table = []
-        table.append({"name": self.player_name, "score": score, "when": datetime.utcnow().isoformat()+"Z"})
-        table = sorted(table, key=lambda e: -e['score'])
-        table = table[:50]
-        with open(LEADERBOARD_FILE, 'w') as f:
-            json.dump(table, f, indent=2)
+    def record_score(self, score, time_taken=0):
+        entry = {"name": self.player_name, "score": score, "time": time_taken,
+                 "when": datetime.utcnow().isoformat()+"Z"}
+        self.leaderboard.add(entry)
+        self.frame_monitor.start()
+        self.writer.save(entry)
         self.show_leaderboard()
 
+    def on_leaderboard_loaded(self, seconds):
+        Logger.info(f"Leaderboard: loaded {len(self.leaderboard.entries)} entries in "
+                    f"{seconds * 1000:.1f} ms (worker thread)")
+
+    def on_leaderboard_saved(self, ok, seconds):
+        worst = self.frame_monitor.stop()
+        Logger.info(f"Leaderboard: saved={ok} in {seconds * 1000:.1f} ms (worker thread); "
+                    f"UI frames during save: {self.frame_monitor.frames}, max {worst * 1000:.1f} ms, "
+                    f"{self.frame_monitor.over_budget} over {FRAME_BUDGET * 1000:.0f} ms")
+
 if __name__ == '__main__':
     GuessApp().run()
\ No newline at end of file
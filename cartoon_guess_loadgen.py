@@ -0,0 +1,125 @@
+# cartoon_guess_loadgen.py
+"""
+Load generator for cartoon_guess_server.py
+ - Opens many concurrent WebSocket sessions (one per simulated browser)
+ - Each session plays rounds with a binary-search player (start -> guesses -> result)
+ - Reports sessions connected, messages/second and round-trip latency percentiles
+
+Every bot round is a real finished round, so run the server with --no-save (or point
+CARTOON_GUESS_STORE at a scratch file) to keep botN scores out of the real leaderboard:
+  python cartoon_guess_server.py --no-save
+  python cartoon_guess_loadgen.py --clients 2000 --rounds 5
+(raise the open-files limit with `ulimit -n` for very large client counts)
+"""
+
+import asyncio, argparse, base64, json, os, time
+
+from cartoon_guess_server import WebSocket, accept_key
+
+
+async def connect(host, port, path='/ws'):
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+                  f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                  "Sec-WebSocket-Version: 13\r\n\r\n").encode('latin-1'))
+    await writer.drain()
+    status = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        k, _, v = line.decode('latin-1').partition(':')
+        headers[k.strip().lower()] = v.strip()
+    if b' 101 ' not in status or headers.get('sec-websocket-accept') != accept_key(key):
+        writer.close()
+        raise ConnectionError("handshake failed: " + status.decode('latin-1').strip())
+    return WebSocket(reader, writer, client=True)
+
+
+async def request(ws, msg, latencies):
+    t0 = time.perf_counter()
+    await ws.send(json.dumps(msg))
+    reply = await ws.recv()
+    latencies.append(time.perf_counter() - t0)
+    if reply is None:
+        raise ConnectionError("closed")
+    return json.loads(reply)
+
+
+async def player(i, args, stats, latencies):
+    try:
+        ws = await connect(args.host, args.port)
+    except (OSError, ConnectionError):
+        stats['failed'] += 1
+        return
+    stats['connected'] += 1
+    try:
+        for r in range(args.rounds):
+            level = str(1 + (i + r) % 3)
+            state = await request(ws, {"type": "start", "level": level, "name": f"bot{i}"}, latencies)
+            low, high = 1, state["range"]
+            if r % 2:
+                await request(ws, {"type": "hint"}, latencies)
+            while True:
+                guess = (low + high) // 2
+                reply = await request(ws, {"type": "guess", "value": guess}, latencies)
+                result = reply.get("result")
+                if result == "low":
+                    low = guess + 1
+                elif result == "high":
+                    high = guess - 1
+                else:
+                    stats['rounds'] += 1
+                    break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        stats['failed'] += 1
+    finally:
+        await ws.close()
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def run(args):
+    stats = {'connected': 0, 'failed': 0, 'rounds': 0}
+    latencies = []
+    t0 = time.perf_counter()
+    tasks = []
+    for i in range(args.clients):
+        tasks.append(asyncio.create_task(player(i, args, stats, latencies)))
+        if i % 200 == 199:
+            await asyncio.sleep(0)  # don't SYN-flood the listen backlog
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - t0
+    print(f"clients: {stats['connected']} connected, {stats['failed']} failed")
+    print(f"rounds : {stats['rounds']} in {elapsed:.2f}s")
+    print(f"msgs   : {len(latencies):,} request/response pairs, {len(latencies) / elapsed:,.0f}/s")
+    print(f"latency: p50 {_percentile(latencies, 0.50) * 1000:.1f} ms, "
+          f"p99 {_percentile(latencies, 0.99) * 1000:.1f} ms, "
+          f"max {max(latencies, default=0) * 1000:.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for cartoon_guess_server.py")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args(argv)
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, args.clients * 2 + 64)), hard))
+    except Exception:
+        pass
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
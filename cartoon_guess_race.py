@@ -0,0 +1,313 @@
+# cartoon_guess_race.py
+"""
+Race mode for the Cartoon Number Guessing Game.
+ - A room holds one secret (same LEVELS / scoring as the console edition) and many players;
+   a player who disconnects is dropped before the start and forfeits once it has started,
+   so a race always reaches its finish
+ - Every state change is serialised to JSON once and fanned out to all subscribers
+ - Each subscriber has its own bounded outbox: updates for the same player are coalesced
+   (latest progress wins); a client that falls more than the limit behind has its queued
+   per-player updates swapped for one fresh room snapshot (control events such as start /
+   finish are never dropped), so a slow client can never stall the room or lose state
+ - Transport-agnostic (asyncio); the web server wires subscribers to WebSockets
+
+Run `python cartoon_guess_race.py` for a local fan-out benchmark (messages/second per room).
+"""
+
+import asyncio, json, random, time
+from collections import OrderedDict
+
+from cartoon_guess_hints import HintEngine
+from cartoon_guess_rules import (LEVELS, HINTS_PER_ROUND, base_score, apply_miss,
+                                 apply_hint, final_score)
+
+OUTBOX_LIMIT = 256
+SNAPSHOT_KEY = ("room",)
+
+# -------------------------
+# Subscribers
+# -------------------------
+class Subscriber:
+    """Per-client outbox. offer() never blocks; the client drains with next().
+    Keyed entries are coalescible state; key=None marks a control event that is always kept.
+    resync() returns a full snapshot payload used when the client falls too far behind."""
+
+    def __init__(self, name, limit=OUTBOX_LIMIT, resync=None):
+        self.name = name
+        self.limit = limit
+        self.resync = resync
+        self.dropped = 0
+        self.coalesced = 0
+        self.resyncs = 0
+        self.closed = False
+        self._outbox = OrderedDict()
+        self._seq = 0
+        self._ready = asyncio.Event()
+
+    def offer(self, key, payload):
+        if self.closed:
+            return
+        if key is not None and key in self._outbox:
+            # newer progress for the same player replaces the queued one
+            del self._outbox[key]
+            self.coalesced += 1
+        elif len(self._outbox) >= self.limit:
+            if self.resync is not None:
+                self._resynchronise()
+                if key is not None:
+                    return  # the fresh snapshot already includes this update
+            else:
+                self._drop_oldest_state()
+        if key is None:
+            self._seq += 1
+            key = ("event", self._seq)
+        self._outbox[key] = payload
+        self._ready.set()
+
+    def _resynchronise(self):
+        stale = [k for k in self._outbox if k[0] != "event"]
+        for k in stale:
+            del self._outbox[k]
+        self.dropped += len(stale)
+        self.resyncs += 1
+        self._outbox[SNAPSHOT_KEY] = self.resync()
+        self._ready.set()
+
+    def _drop_oldest_state(self):
+        for k in self._outbox:
+            if k[0] != "event":
+                del self._outbox[k]
+                self.dropped += 1
+                return
+
+    def pending(self):
+        return len(self._outbox)
+
+    async def next(self):
+        """Wait for the next payload (bytes). Returns None once closed and drained."""
+        while not self._outbox:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._outbox.popitem(last=False)[1]
+
+    def close(self):
+        self.closed = True
+        self._ready.set()
+
+# -------------------------
+# Room
+# -------------------------
+class PlayerState:
+    def __init__(self, name, level_choice, secret, rng):
+        self.name = name
+        self.attempts_left = LEVELS[level_choice][2]
+        self.score = base_score(level_choice)
+        self.hint_uses = 0
+        self.hints = HintEngine(secret, rng)
+        self.finished = False
+        self.won = False
+        self.time = 0
+
+    def progress(self):
+        return {
+            "name": self.name,
+            "attempts_left": self.attempts_left,
+            "hints_used": self.hint_uses,
+            "score": self.score,
+            "finished": self.finished,
+            "won": self.won,
+            "time": self.time,
+        }
+
+
+class RaceRoom:
+    """Many players racing on one shared secret."""
+
+    def __init__(self, room_id, level_choice='1', secret=None, rand=random):
+        self.room_id = room_id
+        self.level_choice = level_choice if level_choice in LEVELS else '1'
+        self.level_name, self.rng, self.max_attempts = LEVELS[self.level_choice]
+        self.secret = secret if secret is not None else rand.randint(1, self.rng)
+        self.players = {}
+        self.subscribers = set()
+        self.started = None
+        self.finish_order = []
+        self.published = 0
+
+    # --- fan-out ---
+    def publish(self, message, key=None):
+        """Serialise once, hand the same bytes to every subscriber."""
+        payload = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        for sub in self.subscribers:
+            sub.offer(key, payload)
+        self.published += 1
+        return payload
+
+    def subscribe(self, name, limit=OUTBOX_LIMIT):
+        sub = Subscriber(name, limit, resync=self.snapshot_payload)
+        self.subscribers.add(sub)
+        # late joiners get the current standings straight away
+        sub.offer(SNAPSHOT_KEY, self.snapshot_payload())
+        return sub
+
+    def unsubscribe(self, sub):
+        self.subscribers.discard(sub)
+        sub.close()
+
+    def snapshot_payload(self):
+        return json.dumps(self.snapshot(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def snapshot(self):
+        return {
+            "type": "room",
+            "room": self.room_id,
+            "level": self.level_name,
+            "range": self.rng,
+            "attempts": self.max_attempts,
+            "started": self.started is not None,
+            "players": [p.progress() for p in self.players.values()],
+        }
+
+    # --- game flow ---
+    def join(self, name):
+        if name not in self.players:
+            self.players[name] = PlayerState(name, self.level_choice, self.secret, self.rng)
+            self.publish({"type": "join", "player": self.players[name].progress()}, key=("player", name))
+        return self.players[name]
+
+    def attached(self, name):
+        """True while a connected subscriber plays under this name."""
+        return any(sub.name == name and not sub.closed for sub in self.subscribers)
+
+    def leave(self, name):
+        """A player disconnected: drop them before the start, else they forfeit the race."""
+        player = self.players.get(name)
+        if player is None or player.finished:
+            return
+        if self.started is None:
+            del self.players[name]
+            self.publish({"type": "leave", "name": name})
+            return
+        player.finished = True
+        player.score = 0
+        player.time = self.elapsed()
+        self.publish({"type": "progress", "player": player.progress()}, key=("player", name))
+        if self.all_finished():
+            self.publish({"type": "finish", "secret": self.secret, "standings": self.standings()})
+
+    def start(self):
+        if self.started is None:
+            self.started = time.time()
+            self.publish({"type": "start", "range": self.rng, "attempts": self.max_attempts})
+
+    def elapsed(self):
+        return int(time.time() - self.started) if self.started else 0
+
+    def guess(self, name, guess):
+        """Returns 'low', 'high', 'correct', 'out' or an error string."""
+        player = self.players.get(name)
+        if player is None:
+            return "not in room"
+        if self.started is None:
+            return "not started"
+        if player.finished:
+            return "finished"
+        if guess == self.secret:
+            player.time = self.elapsed()
+            player.score = final_score(player.score, player.time)
+            player.finished = player.won = True
+            self.finish_order.append(name)
+            result = "correct"
+        else:
+            result = "low" if guess < self.secret else "high"
+            player.hints.observe(guess)
+            player.attempts_left -= 1
+            player.score = apply_miss(player.score)
+            if player.attempts_left <= 0:
+                player.finished = True
+                player.score = 0
+                player.time = self.elapsed()
+                result = "out"
+        self.publish({"type": "progress", "player": player.progress()}, key=("player", name))
+        if self.all_finished():
+            self.publish({"type": "finish", "secret": self.secret, "standings": self.standings()})
+        return result
+
+    def hint(self, name):
+        player = self.players.get(name)
+        if player is None or player.finished or self.started is None:
+            return None
+        if player.hint_uses >= HINTS_PER_ROUND:
+            return None
+        text, informative = player.hints.give()
+        if not informative:
+            return text  # nothing ruled out: free, and nothing changed to publish
+        player.hint_uses += 1
+        player.score = apply_hint(player.score)
+        self.publish({"type": "progress", "player": player.progress()}, key=("player", name))
+        return text
+
+    def all_finished(self):
+        return bool(self.players) and all(p.finished for p in self.players.values())
+
+    def standings(self):
+        ranked = sorted(self.players.values(), key=lambda p: (-p.score, p.time))
+        return [p.progress() for p in ranked]
+
+# -------------------------
+# Benchmark
+# -------------------------
+async def _bench(players=200, updates=2000, slow=5):
+    room = RaceRoom("bench", level_choice='3')
+    delivered = 0
+
+    async def fast_client(sub):
+        nonlocal delivered
+        while await sub.next() is not None:
+            delivered += 1
+
+    async def slow_client(sub):
+        nonlocal delivered
+        while await sub.next() is not None:
+            delivered += 1
+            await asyncio.sleep(0.01)
+
+    subs = []
+    tasks = []
+    for i in range(players):
+        sub = room.subscribe(f"p{i}")
+        subs.append(sub)
+        tasks.append(asyncio.create_task(slow_client(sub) if i < slow else fast_client(sub)))
+    names = [room.join(f"p{i}").name for i in range(players)]
+    room.start()
+
+    t0 = time.perf_counter()
+    for n in range(updates):
+        # progress updates only (no one finishes), round-robin over players
+        name = names[n % players]
+        room.publish({"type": "progress", "player": room.players[name].progress()},
+                     key=("player", name))
+        if n % 50 == 0:
+            await asyncio.sleep(0)
+    publish_time = time.perf_counter() - t0
+    await asyncio.sleep(0.05)
+    drain_time = time.perf_counter() - t0
+
+    for sub in subs:
+        room.unsubscribe(sub)
+    for t in tasks:
+        t.cancel()
+    dropped = sum(s.dropped for s in subs)
+    coalesced = sum(s.coalesced for s in subs)
+    resyncs = sum(s.resyncs for s in subs)
+    print(f"room with {players} subscribers ({slow} slow), {updates} state updates")
+    print(f"  publish: {updates / publish_time:,.0f} updates/s "
+          f"({updates * players / publish_time:,.0f} messages/s fanned out)")
+    print(f"  delivered {delivered:,} messages in {drain_time:.2f}s; "
+          f"coalesced {coalesced:,}, dropped {dropped:,} (replaced by {resyncs:,} snapshots)")
+
+
+if __name__ == '__main__':
+    asyncio.run(_bench())
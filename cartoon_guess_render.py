@@ -0,0 +1,168 @@
+# cartoon_guess_render.py
+"""
+Console rendering layer for the Cartoon Number Guessing console edition.
+ - Collects a whole frame (menu, feedback lines, prompt) in memory
+ - Writes each frame with a single buffered write + flush
+ - Clears / redraws with ANSI escape sequences instead of spawning 'clear'/'cls'
+ - Falls back to plain text on dumb terminals, pipes and old Windows consoles
+ - Tracks bytes written and time spent per frame
+
+Run `python cartoon_guess_render.py` for a quick frame benchmark.
+"""
+
+import io, os, sys, time, platform
+
+# -------------------------
+# ANSI sequences
+# -------------------------
+ANSI_HOME_CLEAR = "\x1b[H\x1b[2J\x1b[3J"   # cursor home, clear screen + scrollback
+PLAIN_CLEAR = "\n" * 3                      # dumb terminals: just leave some space
+
+
+def _enable_windows_vt(stream):
+    """Turn on VT processing for a Windows 10+ console. Returns True on success."""
+    try:
+        import ctypes
+        import msvcrt
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except Exception:
+        return False
+
+
+def detect_ansi(stream):
+    """Decide whether escape sequences can be sent to `stream`.
+    CARTOON_ANSI=0/1 in the environment overrides the detection."""
+    forced = os.environ.get("CARTOON_ANSI")
+    if forced in ("0", "1"):
+        return forced == "1"
+    try:
+        if not stream.isatty():
+            return False
+    except Exception:
+        return False
+    if os.environ.get("TERM", "") == "dumb":
+        return False
+    if platform.system() == "Windows":
+        return _enable_windows_vt(stream)
+    return True
+
+
+class FrameStats:
+    """Running totals for rendered frames."""
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+        self.last_bytes = 0
+        self.last_seconds = 0.0
+
+    def record(self, nbytes, seconds):
+        self.frames += 1
+        self.bytes_written += nbytes
+        self.seconds += seconds
+        self.last_bytes = nbytes
+        self.last_seconds = seconds
+
+    def summary(self):
+        if not self.frames:
+            return "0 frames"
+        avg_bytes = self.bytes_written / self.frames
+        avg_ms = self.seconds / self.frames * 1000.0
+        return (f"{self.frames} frames, {self.bytes_written} bytes "
+                f"(avg {avg_bytes:.0f} B, {avg_ms:.3f} ms/frame)")
+
+
+class ConsoleRenderer:
+    """Buffers console output and flushes it one frame at a time."""
+
+    def __init__(self, stream=None, ansi=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self.ansi = detect_ansi(self.stream) if ansi is None else ansi
+        self.stats = FrameStats()
+        self._buf = io.StringIO()
+        self._encoding = getattr(self.stream, "encoding", None) or "utf-8"
+
+    # --- building a frame ---
+    def clear(self):
+        """Start a fresh screen: drops anything pending and queues a clear."""
+        self._buf = io.StringIO()
+        self._buf.write(ANSI_HOME_CLEAR if self.ansi else PLAIN_CLEAR)
+
+    def write(self, text):
+        self._buf.write(text)
+
+    def line(self, *parts, sep=" "):
+        """print()-style line into the current frame."""
+        self._buf.write(sep.join(str(p) for p in parts))
+        self._buf.write("\n")
+
+    # --- output ---
+    def flush(self):
+        """Write the pending frame in one call. Returns bytes written."""
+        data = self._buf.getvalue()
+        if not data:
+            return 0
+        self._buf = io.StringIO()
+        t0 = time.perf_counter()
+        try:
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception:
+            pass
+        elapsed = time.perf_counter() - t0
+        nbytes = len(data.encode(self._encoding, errors="replace"))
+        self.stats.record(nbytes, elapsed)
+        return nbytes
+
+    def ask(self, prompt=""):
+        """Flush the frame with the prompt as its last line, then read input."""
+        self._buf.write(prompt)
+        self.flush()
+        return input()
+
+
+# -------------------------
+# Benchmark
+# -------------------------
+def _bench(frames=2000):
+    sample = [
+        "Main Menu",
+        " 1) Play Game",
+        " 2) View Leaderboard",
+        " 3) Install / Manage Sounds (info)",
+        " 4) Credits / Help",
+        " 5) Quit",
+    ]
+    # line-buffered like a terminal, so every flush is a real write() syscall
+    sink = open(os.devnull, "w", buffering=1, encoding="utf-8")
+    buffered = ConsoleRenderer(stream=sink, ansi=True)
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        buffered.clear()
+        for s in sample:
+            buffered.line(s)
+        buffered.flush()
+    buffered_total = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        for s in sample:
+            print(s, file=sink, flush=True)
+    print_total = time.perf_counter() - t0
+    sink.close()
+
+    print("buffered frames :", buffered.stats.summary())
+    print(f"buffered total  : {buffered_total * 1000:.1f} ms for {frames} frames")
+    print(f"print() per line: {print_total * 1000:.1f} ms for {frames} frames "
+          f"({len(sample)} flushes/frame vs 1)")
+
+
+if __name__ == '__main__':
+    _bench()
@@ -0,0 +1,38 @@
+# cartoon_guess_rules.py
+"""
+Shared game rules for the Cartoon Number Guessing Game (console, Tk, Kivy, race mode, server).
+ - Levels: range and attempts
+ - Scoring: base score by level, -10 per miss, -8 per hint, speed bonus on a win
+"""
+
+LEVELS = {
+    '1': ("Easy", 10, 6),
+    '2': ("Medium", 50, 7),
+    '3': ("Hard", 100, 9)
+}
+
+HINTS_PER_ROUND = 3
+MISS_PENALTY = 10
+HINT_PENALTY = 8
+
+
+def base_score(level_choice):
+    # higher base for easier levels
+    return 100 + ((3 - int(level_choice)) * 10)
+
+
+def apply_miss(score):
+    return max(0, score - MISS_PENALTY)
+
+
+def apply_hint(score):
+    return max(0, score - HINT_PENALTY)
+
+
+def speed_bonus(elapsed):
+    # reward speed
+    return max(10, 60 - elapsed)
+
+
+def final_score(score, elapsed):
+    return max(0, score + speed_bonus(elapsed))
@@ -0,0 +1,533 @@
+# cartoon_guess_server.py
+"""
+Cartoon Number Guessing — Python backend for the web build (standard library only)
+ - Serves index.html / app.js / styles.css (and assets/sounds/*.wav if present) from memory,
+   with strong ETags (304 on If-None-Match) and pre-gzipped bodies (the gzip coding has its
+   own ETag, so caches never mix up the two representations)
+ - WebSocket endpoint /ws runs the rounds server-side: the secret, attempts, hints and
+   score never leave the server (same rules + hint engine as the console edition)
+ - Race rooms (cartoon_guess_race) are available over the same socket
+ - Scores come only from finished server-side rounds and go to the shared leaderboard store
+   (cartoon_guess_storage: leaderboard.json, or SQLite via CARTOON_GUESS_STORE)
+
+Run:  python cartoon_guess_server.py [--host 0.0.0.0] [--port 8000] [--no-save]
+Then open http://localhost:8000/
+Load test: start the server with --no-save (scores stay in memory, the store is untouched),
+then run python cartoon_guess_loadgen.py
+"""
+
+import asyncio, base64, gzip, hashlib, json, os, random, struct, sys, time, argparse
+from datetime import datetime
+
+from cartoon_guess_hints import HintEngine
+from cartoon_guess_race import RaceRoom
+from cartoon_guess_storage import open_store, rank_key
+from cartoon_guess_rules import (LEVELS, HINTS_PER_ROUND, base_score, apply_miss,
+                                 apply_hint, final_score)
+
+# -------------------------
+# Config
+# -------------------------
+WEB_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(WEB_DIR, "assets")
+SOUNDS_DIR = os.path.join(ASSETS_DIR, "sounds")
+
+STATIC_FILES = {
+    '/': 'index.html',
+    '/index.html': 'index.html',
+    '/app.js': 'app.js',
+    '/styles.css': 'styles.css',
+}
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.wav': 'audio/wav',
+}
+MAX_HEADER_LINES = 64
+MAX_MESSAGE = 4096          # client messages are tiny; anything bigger is dropped
+NAME_LIMIT = 24
+
+# -------------------------
+# Static files
+# -------------------------
+class StaticFile:
+    """File body held in memory with its ETag and (when worth it) a gzipped copy."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.body = f.read()
+        digest = hashlib.sha1(self.body).hexdigest()[:20]
+        self.etag = '"' + digest + '"'
+        self.gzip_etag = '"' + digest + '-gz"'
+        self.content_type = CONTENT_TYPES.get(os.path.splitext(path)[1], 'application/octet-stream')
+        self.gzipped = None
+        if self.content_type.startswith(('text/', 'application/javascript')):
+            packed = gzip.compress(self.body, 9, mtime=0)
+            if len(packed) < len(self.body):
+                self.gzipped = packed
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match check (weak comparison, as RFC 9110 prescribes for this header)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def load_static(web_dir=WEB_DIR):
+    files = {}
+    for url, name in STATIC_FILES.items():
+        path = os.path.join(web_dir, name)
+        if os.path.exists(path):
+            files[url] = StaticFile(path)
+    if os.path.isdir(SOUNDS_DIR):
+        for name in os.listdir(SOUNDS_DIR):
+            if name.endswith('.wav'):
+                files['/assets/sounds/' + name] = StaticFile(os.path.join(SOUNDS_DIR, name))
+    return files
+
+# -------------------------
+# WebSocket framing (RFC 6455)
+# -------------------------
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONT, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+def accept_key(key):
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+
+
+def apply_mask(data, mask):
+    if not data:
+        return data
+    n = len(data)
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(key, 'big')).to_bytes(n, 'big')
+
+
+def encode_frame(payload, opcode=OP_TEXT, mask=False):
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    n = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if n < 126:
+        header = struct.pack('!BB', 0x80 | opcode, mask_bit | n)
+    elif n < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, mask_bit | 126, n)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, mask_bit | 127, n)
+    if mask:
+        key = os.urandom(4)
+        return header + key + apply_mask(payload, key)
+    return header + payload
+
+
+async def read_frame(reader, max_size=MAX_MESSAGE):
+    """Returns (fin, opcode, payload). Raises ValueError on oversized frames."""
+    b1, b2 = await reader.readexactly(2)
+    fin, opcode = b1 & 0x80, b1 & 0x0F
+    n = b2 & 0x7F
+    if n == 126:
+        n = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif n == 127:
+        n = struct.unpack('!Q', await reader.readexactly(8))[0]
+    if n > max_size:
+        raise ValueError("frame too large")
+    mask = await reader.readexactly(4) if b2 & 0x80 else None
+    payload = await reader.readexactly(n) if n else b''
+    if mask:
+        payload = apply_mask(payload, mask)
+    return bool(fin), opcode, payload
+
+
+class WebSocket:
+    """Minimal server/client side WebSocket over asyncio streams."""
+
+    def __init__(self, reader, writer, client=False):
+        self.reader = reader
+        self.writer = writer
+        self.client = client  # clients must mask their frames
+        self.closed = False
+
+    async def recv(self):
+        """Next text message as str, or None when the connection is closed."""
+        parts = []
+        while True:
+            try:
+                fin, opcode, payload = await read_frame(self.reader)
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                self.closed = True
+                return None
+            if opcode == OP_PING:
+                await self.send(payload, OP_PONG)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                if not self.closed:
+                    await self.send(payload[:2], OP_CLOSE)
+                self.closed = True
+                return None
+            parts.append(payload)
+            if sum(len(p) for p in parts) > MAX_MESSAGE:
+                self.closed = True
+                return None
+            if fin:
+                return b''.join(parts).decode('utf-8', errors='replace')
+
+    async def send(self, payload, opcode=OP_TEXT):
+        if self.closed and opcode != OP_CLOSE:
+            return
+        try:
+            self.writer.write(encode_frame(payload, opcode, mask=self.client))
+            await self.writer.drain()
+        except ConnectionError:
+            self.closed = True
+
+    async def close(self):
+        if not self.closed:
+            await self.send(struct.pack('!H', 1000), OP_CLOSE)
+            self.closed = True
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+# -------------------------
+# Server-side rounds
+# -------------------------
+class GameSession:
+    """One player's single-player round, kept entirely on the server."""
+
+    def __init__(self, name):
+        self.name = name
+        self.secret = None
+
+    def start(self, level_choice, name=None):
+        if name:
+            self.name = name
+        level_choice = level_choice if level_choice in LEVELS else '1'
+        self.level_choice = level_choice
+        self.level_name, self.rng, self.attempts_left = LEVELS[level_choice]
+        self.secret = random.randint(1, self.rng)
+        self.score = base_score(level_choice)
+        self.hint_uses = 0
+        self.hints = HintEngine(self.secret, self.rng)
+        self.start_time = time.time()
+        return self.state("started")
+
+    def state(self, kind, **extra):
+        msg = {
+            "type": kind,
+            "level": self.level_name,
+            "range": self.rng,
+            "attempts_left": self.attempts_left,
+            "hints_left": HINTS_PER_ROUND - self.hint_uses,
+            "score": self.score,
+        }
+        msg.update(extra)
+        return msg
+
+    def active(self):
+        return self.secret is not None and self.attempts_left > 0
+
+    def hint(self):
+        if not self.active():
+            return {"type": "error", "message": "Start a round first!"}
+        if self.hint_uses >= HINTS_PER_ROUND:
+            return {"type": "error", "message": "No hints left."}
+        text, informative = self.hints.give()
+        if informative:
+            self.hint_uses += 1
+            self.score = apply_hint(self.score)
+        return self.state("hint", text=text)
+
+    def guess(self, value):
+        """Returns (message, finished_entry_or_None)."""
+        if not self.active():
+            return {"type": "error", "message": "Start a round first!"}, None
+        elapsed = int(time.time() - self.start_time)
+        if value == self.secret:
+            total = final_score(self.score, elapsed)
+            self.attempts_left = 0
+            self.score = total
+            return self.state("result", result="correct", secret=self.secret, time=elapsed), \
+                self._entry(total, elapsed)
+        self.hints.observe(value)
+        self.attempts_left -= 1
+        self.score = apply_miss(self.score)
+        if self.attempts_left <= 0:
+            self.score = 0
+            return self.state("result", result="out", secret=self.secret, time=elapsed), \
+                self._entry(0, elapsed)
+        return self.state("result", result="low" if value < self.secret else "high"), None
+
+    def _entry(self, score, elapsed):
+        return {"name": self.name, "score": score, "time": elapsed,
+                "when": datetime.utcnow().isoformat() + "Z"}
+
+# -------------------------
+# Server
+# -------------------------
+def _json(msg):
+    return json.dumps(msg, ensure_ascii=False, separators=(",", ":"))
+
+
+def _name(msg):
+    return str(msg.get("name") or "").strip()[:NAME_LIMIT] or "Player"
+
+
+class GameServer:
+    def __init__(self, web_dir=WEB_DIR, store=None, persist=True):
+        self.static = load_static(web_dir)
+        self.store = store if store is not None else open_store()
+        self.persist = persist  # False: finished rounds only reach the in-memory leaderboard
+        self.leaderboard = self.store.top(50)
+        self._pending_scores = []
+        self._save_task = None
+        self.rooms = {}
+        self.sessions = 0
+        self.peak_sessions = 0
+
+    # --- leaderboard ---
+    def add_score(self, entry):
+        self.leaderboard.append(entry)
+        self.leaderboard.sort(key=rank_key)
+        del self.leaderboard[50:]
+        if not self.persist:
+            return
+        self._pending_scores.append(entry)
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.get_running_loop().create_task(self._save_scores())
+
+    async def _save_scores(self):
+        # let a burst of finishes coalesce into one batch insert, off the event loop
+        while self._pending_scores:
+            await asyncio.sleep(0.5)
+            batch, self._pending_scores = self._pending_scores, []
+            await asyncio.get_running_loop().run_in_executor(None, self._write_scores, batch)
+
+    def _write_scores(self, batch):
+        try:
+            self.store.add_many(batch)
+        except Exception as e:
+            print("Could not save leaderboard:", e, file=sys.stderr)
+
+    # --- HTTP ---
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                except ValueError:  # longer than the stream limit
+                    await self._respond(writer, 400, b'Bad Request')
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, b'Bad Request')
+                    break
+                headers = {}
+                try:
+                    for _ in range(MAX_HEADER_LINES):
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        k, _, v = line.decode('latin-1').partition(':')
+                        headers[k.strip().lower()] = v.strip()
+                    else:
+                        raise ValueError("too many header lines")
+                except ValueError:  # a header line over the stream limit, or too many of them
+                    await self._respond(writer, 431, b'Request Header Fields Too Large')
+                    break
+                path = target.split('?', 1)[0]
+                if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                    await self._websocket(reader, writer, headers)
+                    return
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                if method not in ('GET', 'HEAD'):
+                    await self._respond(writer, 405, b'Method Not Allowed', keep_alive=keep_alive)
+                else:
+                    await self._serve_static(writer, path, headers, method == 'HEAD', keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def _respond(self, writer, status, body, extra=(), keep_alive=False, head=False):
+        reason = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+                  405: 'Method Not Allowed',
+                  431: 'Request Header Fields Too Large'}.get(status, 'OK')
+        lines = [f"HTTP/1.1 {status} {reason}", f"Content-Length: {len(body)}",
+                 "Connection: " + ("keep-alive" if keep_alive else "close")]
+        lines.extend(extra)
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+        if body and not head:
+            writer.write(body)
+        await writer.drain()
+
+    async def _serve_static(self, writer, path, headers, head, keep_alive):
+        f = self.static.get(path)
+        if f is None:
+            await self._respond(writer, 404, b'Not Found', keep_alive=keep_alive)
+            return
+        use_gzip = f.gzipped is not None and 'gzip' in headers.get('accept-encoding', '')
+        etag = f.gzip_etag if use_gzip else f.etag
+        common = [f"ETag: {etag}", "Cache-Control: no-cache", "Vary: Accept-Encoding"]
+        if etag_matches(headers.get('if-none-match'), etag):
+            writer.write(("HTTP/1.1 304 Not Modified\r\n" + "\r\n".join(common) +
+                          "\r\nConnection: " + ("keep-alive" if keep_alive else "close") +
+                          "\r\n\r\n").encode('latin-1'))
+            await writer.drain()
+            return
+        body = f.body
+        extra = [f"Content-Type: {f.content_type}"] + common
+        if use_gzip:
+            body = f.gzipped
+            extra.append("Content-Encoding: gzip")
+        await self._respond(writer, 200, body, extra, keep_alive, head)
+
+    # --- WebSocket sessions ---
+    async def _websocket(self, reader, writer, headers):
+        key = headers.get('sec-websocket-key')
+        if not key:
+            await self._respond(writer, 400, b'Bad Request')
+            return
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                      "Connection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n").encode('latin-1'))
+        await writer.drain()
+        ws = WebSocket(reader, writer)
+        self.sessions += 1
+        self.peak_sessions = max(self.peak_sessions, self.sessions)
+        session = GameSession("Player")
+        race = None  # (room, subscriber, pump task, player name)
+        try:
+            while True:
+                raw = await ws.recv()
+                if raw is None:
+                    break
+                try:
+                    msg = json.loads(raw)
+                    kind = msg.get("type")
+                except (ValueError, AttributeError):
+                    continue
+                if kind == "start":
+                    reply = session.start(str(msg.get("level", "1")), _name(msg))
+                elif kind == "hint":
+                    reply = session.hint()
+                elif kind == "guess":
+                    try:
+                        value = int(msg.get("value"))
+                    except (TypeError, ValueError):
+                        reply = {"type": "error", "message": "Invalid number."}
+                    else:
+                        reply, entry = session.guess(value)
+                        if entry is not None:
+                            self.add_score(entry)
+                elif kind == "leaderboard":
+                    reply = {"type": "leaderboard", "entries": self.leaderboard[:10]}
+                elif kind == "join_room":
+                    if race is not None:
+                        self._leave_room(*race)
+                        race = None
+                    # the player's name is fixed here; later race messages can't change it
+                    race = self._join_room(ws, str(msg.get("room", "lobby"))[:NAME_LIMIT],
+                                           str(msg.get("level", "1")), _name(msg))
+                    if race is not None:
+                        continue
+                    reply = {"type": "error", "message": "That name is already taken in this room."}
+                elif kind in ("race_start", "race_guess", "race_hint") and race is not None:
+                    reply = self._race_action(race[0], kind, race[3], msg)
+                else:
+                    reply = {"type": "error", "message": "Unknown message."}
+                if reply is not None:
+                    await ws.send(_json(reply))
+        finally:
+            if race is not None:
+                self._leave_room(*race)
+            self.sessions -= 1
+            await ws.close()
+
+    def _join_room(self, ws, room_id, level_choice, name):
+        """(room, subscriber, pump task, name), or None if the name is in use in the room.
+        A name whose player has disconnected can be taken again (e.g. after a page reload)."""
+        room = self.rooms.get(room_id)
+        if room is None or room.all_finished():
+            room = self.rooms[room_id] = RaceRoom(room_id, level_choice)
+        if room.attached(name):
+            return None
+        sub = room.subscribe(name)
+        room.join(name)
+
+        async def pump():
+            while True:
+                payload = await sub.next()
+                if payload is None or ws.closed:
+                    return
+                await ws.send(payload)
+
+        return room, sub, asyncio.get_running_loop().create_task(pump()), name
+
+    def _leave_room(self, room, sub, task, name):
+        room.unsubscribe(sub)
+        task.cancel()
+        room.leave(name)
+        if not room.subscribers and self.rooms.get(room.room_id) is room:
+            del self.rooms[room.room_id]
+
+    def _race_action(self, room, kind, name, msg):
+        if kind == "race_start":
+            room.start()
+            return None
+        if kind == "race_hint":
+            text = room.hint(name)
+            return {"type": "race_hint", "text": text} if text else \
+                {"type": "error", "message": "No hints left."}
+        try:
+            value = int(msg.get("value"))
+        except (TypeError, ValueError):
+            return {"type": "error", "message": "Invalid number."}
+        result = room.guess(name, value)
+        return {"type": "race_result", "result": result}
+
+    # --- run ---
+    async def serve(self, host='0.0.0.0', port=8000):
+        server = await asyncio.start_server(self.handle, host, port, backlog=4096)
+        addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+        print(f"Cartoon Guess server on {addrs} — open http://localhost:{port}/")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cartoon Number Guessing web server")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--no-save', action='store_true',
+                        help="don't write scores to the leaderboard store (for load tests)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(GameServer(persist=not args.no_save).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == '__main__':
+    main()
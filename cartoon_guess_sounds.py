@@ -0,0 +1,116 @@
+# cartoon_guess_sounds.py
+"""
+Built-in Cute Cartoon Sound Pack (pop, win, lose, hint, start), synthesised in memory.
+ - Each sound is a short list of notes (frequency sweep + envelope) rendered once and cached
+   as signed 16-bit samples matching the mixer format (the console edition pre-renders the
+   pack on a background thread as soon as pygame is up)
+ - NumPy renders the pack in a few milliseconds; without NumPy a pure-Python renderer
+   fills an array('h') instead (slower, same sound)
+ - Samples are handed to pygame through the buffer protocol (no tobytes()/list copies)
+ - WAV files in assets/sounds/ still win when present
+
+Run `python cartoon_guess_sounds.py` to time the synthesis.
+"""
+
+import array, math, time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_RATE = 22050
+VOLUME = 0.35
+
+# (start Hz, end Hz, seconds, decay per second)
+SOUND_NOTES = {
+    'pop': [(900, 300, 0.08, 30)],
+    'hint': [(1320, 1320, 0.09, 18), (1760, 1760, 0.16, 14)],
+    'start': [(523, 523, 0.08, 10), (659, 659, 0.08, 10), (784, 784, 0.16, 8)],
+    'win': [(523, 523, 0.09, 8), (659, 659, 0.09, 8), (784, 784, 0.09, 8), (1047, 1047, 0.30, 5)],
+    'lose': [(392, 370, 0.16, 6), (330, 311, 0.16, 6), (262, 196, 0.40, 4)],
+}
+
+_cache = {}
+
+# -------------------------
+# Renderers
+# -------------------------
+def _render_numpy(notes, rate):
+    parts = []
+    for f0, f1, dur, decay in notes:
+        n = int(dur * rate)
+        t = np.arange(n, dtype=np.float32) / rate
+        freq = np.linspace(f0, f1, n, dtype=np.float32)
+        phase = np.cumsum(freq) * (2 * math.pi / rate)
+        env = np.minimum(1.0, t / 0.005) * np.exp(-decay * t)
+        # a touch of the octave makes it rounder / more "cartoon"
+        wave = np.sin(phase) + 0.3 * np.sin(2 * phase)
+        parts.append(wave * env)
+    samples = np.concatenate(parts) * (VOLUME * 32767 / 1.3)
+    return samples.astype(np.int16)
+
+
+def _render_python(notes, rate):
+    out = array.array('h')
+    scale = VOLUME * 32767 / 1.3
+    two_pi_over_rate = 2 * math.pi / rate
+    for f0, f1, dur, decay in notes:
+        n = int(dur * rate)
+        step = (f1 - f0) / max(1, n - 1)
+        phase = 0.0
+        for i in range(n):
+            t = i / rate
+            phase += (f0 + step * i) * two_pi_over_rate
+            env = min(1.0, t / 0.005) * math.exp(-decay * t)
+            out.append(int((math.sin(phase) + 0.3 * math.sin(2 * phase)) * env * scale))
+    return out
+
+
+def _to_channels(samples, channels):
+    if channels == 1:
+        return samples
+    if np is not None and isinstance(samples, np.ndarray):
+        return np.ascontiguousarray(np.repeat(samples[:, None], channels, axis=1))
+    out = array.array('h', bytes(len(samples) * channels * 2))
+    for c in range(channels):
+        out[c::channels] = samples
+    return out
+
+
+def get_samples(key, rate=DEFAULT_RATE, channels=1):
+    """Cached int16 samples for one sound (interleaved when channels > 1)."""
+    cache_key = (key, rate, channels)
+    samples = _cache.get(cache_key)
+    if samples is None:
+        notes = SOUND_NOTES[key]
+        mono = _render_numpy(notes, rate) if np is not None else _render_python(notes, rate)
+        samples = _cache[cache_key] = _to_channels(mono, channels)
+    return samples
+
+
+def build_pack(rate=DEFAULT_RATE, channels=1):
+    return {key: get_samples(key, rate, channels) for key in SOUND_NOTES}
+
+# -------------------------
+# pygame glue
+# -------------------------
+def make_pygame_sound(pygame, key):
+    """pygame.mixer.Sound for a synthesised sound, in the mixer's own format.
+    Only signed 16-bit mixers are supported (size -16); anything else gets None."""
+    init = pygame.mixer.get_init()
+    if not init or key not in SOUND_NOTES:
+        return None
+    rate, size, channels = init
+    if size != -16:
+        return None
+    return pygame.mixer.Sound(buffer=get_samples(key, rate, channels))
+
+
+if __name__ == '__main__':
+    t0 = time.perf_counter()
+    pack = build_pack()
+    ms = (time.perf_counter() - t0) * 1000
+    total = sum(len(s) for s in pack.values())
+    print(f"synthesised {len(pack)} sounds ({total:,} samples @ {DEFAULT_RATE} Hz) in {ms:.1f} ms "
+          f"using {'NumPy' if np is not None else 'pure Python'}")
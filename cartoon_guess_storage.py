@@ -0,0 +1,270 @@
+# cartoon_guess_storage.py
+"""
+Leaderboard storage backends shared by every front-end (console, Kivy, web server).
+ - JsonStore: the original leaderboard.json (top 50, sorted by score desc then time asc)
+ - SqliteStore: SQLite in WAL mode with an index on (score DESC, time ASC), one reused
+   connection, fixed SQL strings (served from sqlite3's prepared statement cache) and
+   batch inserts in a single transaction; keeps every score
+ - open_store() picks the backend from the file extension (.db/.sqlite/.sqlite3 -> SQLite);
+   CARTOON_GUESS_STORE in the environment overrides the default path
+
+Tools:
+  python cartoon_guess_storage.py migrate [leaderboard.json] [leaderboard.sqlite]
+  python cartoon_guess_storage.py bench [--rows 1000 100000 10000000]
+"""
+
+import abc, json, os, sqlite3, sys, threading, time, argparse
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+DEFAULT_PATH = os.path.join(ASSETS_DIR, "leaderboard.json")
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+
+def rank_key(e):
+    # score desc, then time asc
+    return (-e['score'], e.get('time', 0))
+
+
+class LeaderboardStore(abc.ABC):
+    """Interface every backend implements. Entries are dicts: name, score, time, when.
+    Write errors (disk full, permissions, ...) propagate to the caller."""
+
+    @abc.abstractmethod
+    def top(self, n=10):
+        """Best n entries (all of them when n is None)."""
+
+    def add(self, entry):
+        self.add_many([entry])
+
+    @abc.abstractmethod
+    def add_many(self, entries):
+        """Store a batch of entries."""
+
+    @abc.abstractmethod
+    def iter_entries(self):
+        """All entries in rank order, streamed where the backend allows it."""
+
+    @abc.abstractmethod
+    def count(self):
+        """Number of stored entries."""
+
+    def close(self):
+        pass
+
+# -------------------------
+# JSON
+# -------------------------
+class JsonStore(LeaderboardStore):
+    def __init__(self, path=DEFAULT_PATH, keep=50):
+        self.path = path
+        self.keep = keep
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return []
+
+    def _save(self, table):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(table, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+
+    def top(self, n=10):
+        with self._lock:
+            return sorted(self._load(), key=rank_key)[:n]
+
+    def add_many(self, entries):
+        with self._lock:
+            table = self._load()
+            table.extend(entries)
+            table = sorted(table, key=rank_key)
+            if self.keep is not None:
+                table = table[:self.keep]
+            self._save(table)
+
+    def iter_entries(self):
+        return iter(self.top(None))
+
+    def count(self):
+        with self._lock:
+            return len(self._load())
+
+# -------------------------
+# SQLite
+# -------------------------
+class SqliteStore(LeaderboardStore):
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS scores ('
+        ' id INTEGER PRIMARY KEY,'
+        ' name TEXT NOT NULL,'
+        ' score INTEGER NOT NULL,'
+        ' time INTEGER NOT NULL DEFAULT 0,'
+        ' "when" TEXT NOT NULL DEFAULT \'\')',
+        'CREATE INDEX IF NOT EXISTS scores_rank ON scores (score DESC, time ASC)',
+    )
+    INSERT = 'INSERT INTO scores (name, score, time, "when") VALUES (?, ?, ?, ?)'
+    TOP = 'SELECT name, score, time, "when" FROM scores ORDER BY score DESC, time ASC LIMIT ?'
+    ALL = 'SELECT name, score, time, "when" FROM scores ORDER BY score DESC, time ASC'
+    COUNT = 'SELECT COUNT(*) FROM scores'
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # one connection for the life of the store; the Kivy writer thread and the web
+        # server's executor share it under the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False, cached_statements=32,
+                                     isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            for stmt in self.SCHEMA:
+                self._conn.execute(stmt)
+
+    @staticmethod
+    def _row(entry):
+        return (entry['name'], entry['score'], entry.get('time', 0), entry.get('when', ''))
+
+    @staticmethod
+    def _entry(row):
+        return {"name": row[0], "score": row[1], "time": row[2], "when": row[3]}
+
+    def top(self, n=10):
+        with self._lock:
+            if n is None:
+                rows = self._conn.execute(self.ALL).fetchall()
+            else:
+                rows = self._conn.execute(self.TOP, (n,)).fetchall()
+        return [self._entry(r) for r in rows]
+
+    def add_many(self, entries):
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(self.INSERT, (self._row(e) for e in entries))
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def iter_entries(self, batch=10000):
+        # own cursor on a separate connection so a long export doesn't hold the lock
+        conn = sqlite3.connect(self.path)
+        try:
+            cur = conn.execute(self.ALL)
+            while True:
+                rows = cur.fetchmany(batch)
+                if not rows:
+                    break
+                for r in rows:
+                    yield self._entry(r)
+        finally:
+            conn.close()
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute(self.COUNT).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+# -------------------------
+# Factory
+# -------------------------
+def open_store(path=None):
+    path = path or os.environ.get("CARTOON_GUESS_STORE") or DEFAULT_PATH
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        return SqliteStore(path)
+    return JsonStore(path)
+
+# -------------------------
+# Migration / benchmark
+# -------------------------
+def migrate(src, dst):
+    """Copy every entry from one store to another in a single batch.
+    The target must be empty, so running a migration twice can't duplicate scores."""
+    if os.path.abspath(src) == os.path.abspath(dst):
+        raise ValueError("source and target are the same store")
+    source, target = open_store(src), open_store(dst)
+    try:
+        existing = target.count()
+        if existing:
+            raise ValueError(f"{dst} already holds {existing} entries; migrate into an empty store")
+        entries = list(source.iter_entries())
+        target.add_many(entries)
+        return len(entries)
+    finally:
+        source.close()
+        target.close()
+
+
+def _fake_entries(n, start=0):
+    for i in range(start, start + n):
+        yield {"name": f"P{i % 997}", "score": (i * 7919) % 200, "time": i % 120,
+               "when": "2025-01-01T00:00:00Z"}
+
+
+def bench(rows_list, workdir, json_limit):
+    os.makedirs(workdir, exist_ok=True)
+    print(f"{'backend':<8} {'rows':>10} {'bulk insert':>12} {'top-10':>10} {'single add':>11}")
+    for rows in rows_list:
+        for kind in ('json', 'sqlite'):
+            if kind == 'json' and rows > json_limit:
+                print(f"{kind:<8} {rows:>10,} {'skipped (> --json-limit)':>35}")
+                continue
+            path = os.path.join(workdir, f"bench_{rows}.{'json' if kind == 'json' else 'sqlite'}")
+            for p in (path, path + '-wal', path + '-shm'):
+                if os.path.exists(p):
+                    os.remove(p)
+            # the JSON bench keeps every row so both backends hold the same data
+            store = JsonStore(path, keep=None) if kind == 'json' else SqliteStore(path)
+            t0 = time.perf_counter()
+            chunk = 100000
+            for start in range(0, rows, chunk):
+                store.add_many(list(_fake_entries(min(chunk, rows - start), start)))
+            t_insert = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            store.top(10)
+            t_top = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            store.add({"name": "bench", "score": 150, "time": 10, "when": ""})
+            t_add = time.perf_counter() - t0
+            store.close()
+            print(f"{kind:<8} {rows:>10,} {t_insert:>11.3f}s {t_top * 1000:>8.2f}ms "
+                  f"{t_add * 1000:>9.2f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Leaderboard storage tools")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    m = sub.add_parser('migrate', help="copy a leaderboard into another backend")
+    m.add_argument('src', nargs='?', default=DEFAULT_PATH)
+    m.add_argument('dst', nargs='?', default=os.path.join(ASSETS_DIR, "leaderboard.sqlite"))
+    b = sub.add_parser('bench', help="compare backends")
+    b.add_argument('--rows', type=int, nargs='+', default=[1000, 100000, 10000000])
+    b.add_argument('--dir', default=os.path.join(ASSETS_DIR, "bench"))
+    b.add_argument('--json-limit', type=int, default=100000,
+                   help="skip the JSON backend above this many rows")
+    args = parser.parse_args(argv)
+    if args.cmd == 'migrate':
+        try:
+            n = migrate(args.src, args.dst)
+        except ValueError as e:
+            print("migrate:", e, file=sys.stderr)
+            return 1
+        print(f"migrated {n} entries: {args.src} -> {args.dst}")
+        print(f"set CARTOON_GUESS_STORE={args.dst} to use it")
+    else:
+        bench(args.rows, args.dir, args.json_limit)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
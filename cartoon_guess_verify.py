@@ -0,0 +1,166 @@
+# cartoon_guess_verify.py
+"""
+Score plausibility verifier for Cartoon Number Guessing submissions.
+ - A submission is (score, time, level, attempts, hints); attempts counts every guess,
+   including the winning one
+ - Scores follow play_round: base score by level, -10 per miss, -8 per hint (never below 0),
+   then +max(10, 60 - elapsed) on a win; a lost round scores 0 after using every attempt
+ - `time` is stored a moment after the bonus is computed, so elapsed may be time or time-1
+ - Every feasible (level, attempts, hints, time bucket, score) combination is precomputed,
+   so screening a valid record is a single set lookup; reasons are only worked out for rejects
+
+Run:  python cartoon_guess_verify.py submissions.jsonl [more.csv ...] > rejected.jsonl
+      python cartoon_guess_verify.py --bench 2000000
+"""
+
+import argparse, csv, json, random, sys, time
+
+from cartoon_guess_rules import (LEVELS, HINTS_PER_ROUND, MISS_PENALTY, HINT_PENALTY,
+                                 base_score, speed_bonus)
+
+FIELDS = ("score", "time", "level", "attempts", "hints")
+# speed_bonus() is flat from this elapsed time on; later times share one bucket
+BONUS_FLAT_FROM = 50
+TIME_BUCKETS = BONUS_FLAT_FROM + 2
+
+# '1' / 1 / 'easy' all name the same level
+LEVEL_ALIASES = {}
+for key, (label, _, _) in LEVELS.items():
+    LEVEL_ALIASES.update({key: key, int(key): key, label.lower(): key})
+
+# -------------------------
+# Feasibility tables
+# -------------------------
+def _build_tables():
+    """(level, attempts, hints, time bucket) -> frozenset of feasible winning scores."""
+    table = {}
+    for level, (_, _, max_attempts) in LEVELS.items():
+        base = base_score(level)
+        for attempts in range(1, max_attempts + 1):
+            for hints in range(HINTS_PER_ROUND + 1):
+                pre = max(0, base - MISS_PENALTY * (attempts - 1) - HINT_PENALTY * hints)
+                for bucket in range(TIME_BUCKETS):
+                    scores = set()
+                    for elapsed in (bucket - 1, bucket):
+                        if elapsed >= 0:
+                            scores.add(max(0, pre + speed_bonus(elapsed)))
+                    table[(level, attempts, hints, bucket)] = frozenset(scores)
+    return table
+
+
+WIN_SCORES = _build_tables()
+MAX_ATTEMPTS = {level: tries for level, (_, _, tries) in LEVELS.items()}
+# flat set of every feasible (level alias, attempts, hints, bucket, score) for the fast path
+FEASIBLE = frozenset(
+    (alias, attempts, hints, bucket, score)
+    for alias, level in LEVEL_ALIASES.items()
+    for (lvl, attempts, hints, bucket), scores in WIN_SCORES.items() if lvl == level
+    for score in scores
+) | frozenset(
+    (alias, MAX_ATTEMPTS[level], hints, bucket, 0)
+    for alias, level in LEVEL_ALIASES.items()
+    for hints in range(HINTS_PER_ROUND + 1)
+    for bucket in range(TIME_BUCKETS)
+)
+
+
+def verify(score, time_taken, level, attempts, hints):
+    """Return None if the record is feasible, else the reason it was rejected."""
+    level = LEVEL_ALIASES.get(level if not isinstance(level, str) else level.strip().lower())
+    if level is None:
+        return "unknown level"
+    if not 1 <= attempts <= MAX_ATTEMPTS[level]:
+        return f"attempts must be 1..{MAX_ATTEMPTS[level]}"
+    if not 0 <= hints <= HINTS_PER_ROUND:
+        return f"hints must be 0..{HINTS_PER_ROUND}"
+    if time_taken < 0:
+        return "negative time"
+    if score == 0 and attempts == MAX_ATTEMPTS[level]:
+        return None  # lost round
+    feasible = WIN_SCORES[(level, attempts, hints, min(time_taken, TIME_BUCKETS - 1))]
+    if score in feasible:
+        return None
+    return "score not reachable (expected " + " or ".join(str(s) for s in sorted(feasible)) + ")"
+
+
+def screen(records):
+    """Yield (record, reason) for every rejected record.
+    Records are dicts with FIELDS; missing or non-integer fields are rejected too."""
+    last_bucket = TIME_BUCKETS - 1
+    for rec in records:
+        try:
+            score, time_taken, level, attempts, hints = (
+                int(rec["score"]), int(rec["time"]), rec["level"],
+                int(rec["attempts"]), int(rec["hints"]))
+            if (level, attempts, hints, time_taken if time_taken < last_bucket else last_bucket,
+                    score) in FEASIBLE and time_taken >= 0:
+                continue
+        except (KeyError, TypeError, ValueError):
+            yield rec, "malformed record"
+            continue
+        reason = verify(score, time_taken, level, attempts, hints)
+        if reason is not None:
+            yield rec, reason
+
+# -------------------------
+# Input / CLI
+# -------------------------
+def read_records(path):
+    """Stream records from .csv (header row) or JSON lines ('-' reads stdin)."""
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8', newline='')
+    try:
+        if path.endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield {"raw": line}
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _random_records(n, rand):
+    levels = list(LEVELS)
+    for _ in range(n):
+        level = rand.choice(levels)
+        attempts = rand.randint(1, MAX_ATTEMPTS[level])
+        hints = rand.randint(0, HINTS_PER_ROUND)
+        t = rand.randint(0, 90)
+        score = rand.choice(sorted(WIN_SCORES[(level, attempts, hints, min(t, TIME_BUCKETS - 1))]))
+        if rand.random() < 0.05:
+            score += rand.randint(1, 40)  # tampered
+        yield {"score": score, "time": t, "level": level, "attempts": attempts, "hints": hints}
+
+
+def _bench(n):
+    records = list(_random_records(n, random.Random(1)))
+    t0 = time.perf_counter()
+    rejected = sum(1 for _ in screen(records))
+    elapsed = time.perf_counter() - t0
+    print(f"screened {n:,} records in {elapsed:.2f}s ({n / elapsed:,.0f}/s), rejected {rejected:,}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reject implausible leaderboard submissions")
+    parser.add_argument('inputs', nargs='*', default=['-'], help=".jsonl or .csv files ('-' = stdin)")
+    parser.add_argument('--bench', type=int, metavar='N', help="screen N generated records and exit")
+    args = parser.parse_args(argv)
+    if args.bench:
+        _bench(args.bench)
+        return
+    total_rejected = 0
+    out = sys.stdout
+    for path in args.inputs:
+        for rec, reason in screen(read_records(path)):
+            total_rejected += 1
+            out.write(json.dumps({"record": rec, "reason": reason}, ensure_ascii=False) + "\n")
+    print(f"rejected {total_rejected} record(s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()